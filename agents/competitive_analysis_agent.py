@@ -6,16 +6,92 @@ NOW WITH REAL COMPETITOR WEBSITE SCRAPING!
 Agent 3 in the SEO Agent System.
 """
 
-from typing import List, Dict, Any
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from backend.llm_client import llm_client
 from backend.config import PRODUCT_COMPETITORS
 from agents.competitor_agent import CompetitorFetchingAgent
+from backend.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sentence boundary used when deduplicating/truncating competitor content
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Per-competitor character budget for content sent to the LLM
+_MAX_COMPETITOR_CONTENT_CHARS = 4000
+
+
+def _slim_competitor_content(competitor_content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Deduplicate and truncate scraped competitor content before it reaches
+    the LLM prompt. Scraped pages carry a lot of repeated boilerplate
+    (nav/footer fragments, repeated sentences across a site's pages), which
+    inflates prompt tokens without adding signal.
+
+    - Drops sentences already seen within the same competitor's content
+    - Drops sentences that appear across multiple competitors (boilerplate)
+    - Truncates each competitor to a sentence-aligned character budget
+    """
+    seen_across_competitors = set()
+    slimmed = []
+
+    for comp in competitor_content:
+        content = comp.get('content', '')
+        if not content:
+            slimmed.append(comp)
+            continue
+
+        seen_here = set()
+        kept_sentences = []
+        kept_chars = 0
+
+        for sentence in _SENTENCE_SPLIT_RE.split(content):
+            sentence = sentence.strip()
+            if len(sentence) < 15:
+                continue
+            fingerprint = hash(sentence.lower())
+            if fingerprint in seen_here or fingerprint in seen_across_competitors:
+                continue
+            seen_here.add(fingerprint)
+            if kept_chars + len(sentence) + 1 > _MAX_COMPETITOR_CONTENT_CHARS:
+                break
+            kept_sentences.append(sentence)
+            kept_chars += len(sentence) + 1
+
+        seen_across_competitors.update(seen_here)
+        slimmed_comp = dict(comp)
+        slimmed_comp['content'] = ' '.join(kept_sentences) if kept_sentences else content[:_MAX_COMPETITOR_CONTENT_CHARS]
+        slimmed.append(slimmed_comp)
+
+    return slimmed
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisResult:
+    """
+    Result of a competitor analysis run.
+
+    A slotted dataclass is smaller than the equivalent dict and avoids
+    re-hashing 12 keys on construction; the lists it carries are references
+    to structures already built downstream.
+    """
+    status: str
+    product: str
+    capability: Dict[str, Any]
+    competitors: Tuple[str, ...]
+    competitors_scraped: int
+    article_keywords: List[Dict[str, Any]]
+    competitor_keywords: List[Dict[str, Any]]
+    suggested_keywords: List[Dict[str, Any]]
+    keyword_mappings: List[Dict[str, Any]]
+    time_range: str
+    timestamp: str
+    analysis_type: str = "dynamic_capability_based"
 
 
 class CompetitiveAnalysisAgent:
@@ -43,7 +119,7 @@ class CompetitiveAnalysisAgent:
         article_content: str = "",
         article_headings: List[str] = None,
         article_url: str = ""
-    ) -> Dict[str, Any]:
+    ) -> AnalysisResult:
         """
         DYNAMIC Capability-Based Competitor Analysis
         
@@ -57,34 +133,38 @@ class CompetitiveAnalysisAgent:
         
         Returns: article_keywords, competitor_keywords, suggested_keywords, mappings
         """
-        print(f"\n{'='*70}")
-        print(f"[CompetitiveAnalysisAgent]  DYNAMIC CAPABILITY-BASED ANALYSIS")
-        print(f"{'='*70}")
-        print(f"[CompetitiveAnalysisAgent] Product: {product}")
-        print(f"[CompetitiveAnalysisAgent] Article URL: {article_url}")
-        print(f"[CompetitiveAnalysisAgent] Article keywords: {len(article_keywords)}")
-        print(f"{'='*70}\n")
-        
-        # Step 1: Get competitor names
-        competitor_data = self.competitor_agent.execute(product)
-        competitor_names = [c['name'] for c in competitor_data["competitors"]]
-        print(f"[CompetitiveAnalysisAgent] Competitors to analyze: {competitor_names}")
+        logger.info("\n%s", '=' * 70)
+        logger.info("[CompetitiveAnalysisAgent]  DYNAMIC CAPABILITY-BASED ANALYSIS")
+        logger.info("%s", '=' * 70)
+        logger.info("[CompetitiveAnalysisAgent] Product: %s", product)
+        logger.info("[CompetitiveAnalysisAgent] Article URL: %s", article_url)
+        logger.info("[CompetitiveAnalysisAgent] Article keywords: %s", len(article_keywords))
+        logger.info("%s\n", '=' * 70)
         
-        # Step 2: IDENTIFY THE CAPABILITY from the article
-        print(f"\n[CompetitiveAnalysisAgent]  Step 1: Identifying article capability...")
-        capability = await self.llm_client.identify_article_capability(
-            title=article_title,
-            headings=article_headings or [],
-            content=article_content,
-            url=article_url
+        # Steps 1 & 2 are independent: competitor fetching is synchronous and
+        # doesn't depend on the capability, so run it in a worker thread while
+        # the capability-identification LLM call is in flight.
+        logger.info("\n[CompetitiveAnalysisAgent]  Step 1: Identifying article capability...")
+        competitor_data, capability = await asyncio.gather(
+            asyncio.to_thread(self.competitor_agent.execute, product),
+            self.llm_client.identify_article_capability(
+                title=article_title,
+                headings=article_headings or [],
+                content=article_content,
+                url=article_url
+            )
         )
-        
-        print(f"[CompetitiveAnalysisAgent]  Capability identified: {capability.get('name')}")
-        print(f"[CompetitiveAnalysisAgent]    Description: {capability.get('description')}")
-        print(f"[CompetitiveAnalysisAgent]    Search terms: {capability.get('competitor_search_terms')}")
+
+        # Single pass, immutable result - this is only logged and returned
+        competitor_names = tuple(c['name'] for c in competitor_data["competitors"])
+        logger.info("[CompetitiveAnalysisAgent] Competitors to analyze: %s", competitor_names)
+
+        logger.info("[CompetitiveAnalysisAgent]  Capability identified: %s", capability.get('name'))
+        logger.info("[CompetitiveAnalysisAgent]    Description: %s", capability.get('description'))
+        logger.info("[CompetitiveAnalysisAgent]    Search terms: %s", capability.get('competitor_search_terms'))
         
         # Step 3: DYNAMICALLY FIND and SCRAPE competitor capability pages
-        print(f"\n[CompetitiveAnalysisAgent]  Step 2: Finding equivalent capability on competitor sites...")
+        logger.info("\n[CompetitiveAnalysisAgent]  Step 2: Finding equivalent capability on competitor sites...")
         
         competitor_content_data = await self.competitor_agent.get_competitor_content_for_capability(
             product=product,
@@ -93,16 +173,22 @@ class CompetitiveAnalysisAgent:
         )
         
         competitor_content = competitor_content_data.get("competitor_content", [])
-        print(f"\n[CompetitiveAnalysisAgent]  Found capability content from {len(competitor_content)} competitors")
+        logger.info("\n[CompetitiveAnalysisAgent]  Found capability content from %s competitors", len(competitor_content))
+
+        # Slim the content before prompting: dedup boilerplate, cap per-competitor size
+        competitor_content = _slim_competitor_content(competitor_content)
         
         for comp in competitor_content:
-            content_len = len(comp.get('content', ''))
-            feature_name = comp.get('competitor_feature_name', 'Unknown')
-            urls_count = len(comp.get('urls_scraped', []))
-            print(f"  - {comp.get('competitor_name')}: '{feature_name}' - {content_len} chars from {urls_count} URLs")
+            logger.info(
+                "  - %s: '%s' - %s chars from %s URLs",
+                comp.get('competitor_name'),
+                comp.get('competitor_feature_name', 'Unknown'),
+                len(comp.get('content', '')),
+                len(comp.get('urls_scraped', []))
+            )
         
         # Step 4: Use LLM to analyze REAL competitor content and extract keywords
-        print(f"\n[CompetitiveAnalysisAgent]  Step 3: Analyzing competitor terminology...")
+        logger.info("\n[CompetitiveAnalysisAgent]  Step 3: Analyzing competitor terminology...")
         keyword_data = await self.llm_client.get_competitor_keywords(
             article_keywords=article_keywords,
             product=product,
@@ -112,20 +198,19 @@ class CompetitiveAnalysisAgent:
             competitor_content=competitor_content  # Pass REAL capability-specific content
         )
         
-        print(f"\n[CompetitiveAnalysisAgent]  Generated {len(keyword_data['competitor_keywords'])} competitor keywords")
-        print(f"[CompetitiveAnalysisAgent]  Generated {len(keyword_data['suggested_keywords'])} suggested keywords")
+        logger.info("\n[CompetitiveAnalysisAgent]  Generated %s competitor keywords", len(keyword_data['competitor_keywords']))
+        logger.info("[CompetitiveAnalysisAgent]  Generated %s suggested keywords", len(keyword_data['suggested_keywords']))
         
-        return {
-            "status": "success",
-            "product": product,
-            "capability": capability,
-            "competitors": competitor_names,
-            "competitors_scraped": len(competitor_content),
-            "article_keywords": keyword_data["article_keywords"],
-            "competitor_keywords": keyword_data["competitor_keywords"],
-            "suggested_keywords": keyword_data["suggested_keywords"],
-            "keyword_mappings": keyword_data["keyword_mappings"],
-            "time_range": time_range,
-            "timestamp": datetime.now().isoformat(),
-            "analysis_type": "dynamic_capability_based"
-        }
+        return AnalysisResult(
+            status="success",
+            product=product,
+            capability=capability,
+            competitors=competitor_names,
+            competitors_scraped=len(competitor_content),
+            article_keywords=keyword_data["article_keywords"],
+            competitor_keywords=keyword_data["competitor_keywords"],
+            suggested_keywords=keyword_data["suggested_keywords"],
+            keyword_mappings=keyword_data["keyword_mappings"],
+            time_range=time_range,
+            timestamp=datetime.now().isoformat()
+        )
@@ -5,17 +5,92 @@ Responsible for fetching competitor lists and SCRAPING competitor websites
 to extract real keywords from competitor content.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from collections import defaultdict
+from urllib.parse import urljoin, urlparse
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
+import itertools
 import re
 import asyncio
+import time
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from backend.cache import TTLCache
 from backend.config import PRODUCT_COMPETITORS
+from backend.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Strainers for the BS4 fallback parsers: only build tree nodes for the tags
+# the extraction logic actually touches instead of the whole DOM.
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+# Anchor hrefs/texts that indicate help/documentation pages. One compiled
+# alternation scanned in C replaces a per-anchor Python loop over keywords.
+_HELP_RE = re.compile(
+    r'help|support|docs|documentation|knowledge|faq|guide|learn|resources|how-to|blog|features|product',
+    re.I
+)
+# Class-name pattern for likely main-content <div>s in the BS4 fallback,
+# compiled once instead of per extracted page.
+_MAIN_CLASS_RE = re.compile(r'content|main|body', re.I)
+
+# Cap on downloaded body size: enough for title + headings + the 8KB of
+# content extraction keeps, without decoding/parsing multi-MB pages.
+_MAX_BODY_BYTES = 512_000
+
+# Speculative paths probed on every competitor domain. No trailing-slash
+# variants: the client follows redirects, so "/help" covers "/help/" and
+# each duplicate was a wasted HTTP round trip.
+_COMMON_PATHS = (
+    "/help",
+    "/support",
+    "/docs",
+    "/documentation",
+    "/blog",
+    "/features",
+    "/product",
+    "/products",
+    "/resources",
+    "/learn",
+    "/guides",
+    "/faq",
+    "/knowledge-base",
+    "/articles",
+)
+
+_CONTENT_STRAINER = SoupStrainer([
+    'title', 'h1', 'h2', 'h3', 'h4', 'main', 'article', 'div',
+    'script', 'style', 'nav', 'footer', 'header', 'aside', 'noscript'
+])
+
+
+class HostRateLimiter:
+    """
+    Per-host token-bucket rate limiter.
+
+    Keeps a steady request rate per competitor host (with a small burst
+    allowance) instead of a blanket sleep before every fetch - requests to
+    different hosts no longer delay each other at all.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 4):
+        self.rate = rate  # tokens (requests) per second per host
+        self.burst = burst
+        self._buckets: Dict[str, tuple] = {}  # host -> (tokens, last_refill)
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request token is available for this host."""
+        while True:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+            if tokens >= 1.0:
+                self._buckets[host] = (tokens - 1.0, now)
+                return
+            self._buckets[host] = (tokens, now)
+            await asyncio.sleep((1.0 - tokens) / self.rate)
 
 
 class CompetitorFetchingAgent:
@@ -58,13 +133,74 @@ class CompetitorFetchingAgent:
             }
         ]
         self.headers = self.headers_list[0]
-        self.request_count = 0
+        # Pre-encode each header set once; httpx otherwise normalizes and
+        # byte-encodes the same dicts on every single request.
+        self._headers_cycle = itertools.cycle(
+            [httpx.Headers(h) for h in self.headers_list]
+        )
+        # Competitor lists are low-cardinality (one entry per product) and
+        # rarely change - memoize execute() results across requests.
+        self._execute_cache = TTLCache(maxsize=16, ttl=3600)
+        # Shared HTTP client, created lazily on first fetch so it binds to the
+        # running event loop (__init__ may be called outside any loop).
+        self._client = None
+        self._client_loop = None
+        # Concurrency caps: a global ceiling on simultaneous fetches plus a
+        # per-host cap so no single competitor site gets hammered.
+        self._global_sem = asyncio.Semaphore(32)
+        self._host_sems = defaultdict(lambda: asyncio.Semaphore(4))
+        self._rate_limiter = HostRateLimiter(rate=2.0, burst=4)
+        # Separate cap for LLM calls: the Azure endpoint rate-limits well
+        # below what the scraping semaphores allow.
+        self._llm_sem = asyncio.Semaphore(8)
+        # Per-URL page cache: the same root/docs pages get probed repeatedly
+        # across capabilities and fallback paths within a run.
+        self._page_cache = TTLCache(maxsize=256, ttl=600)
+        # Single-flight: URL -> future for the fetch currently in progress,
+        # shared by every concurrent caller asking for that URL
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient, creating it on first use.
+
+        Reusing one client keeps connections alive across the many pages
+        scraped in a run, skipping a TCP+TLS handshake per request. The client
+        is re-created if the running loop changed (e.g. across test runs).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                # HTTP/2 multiplexes the 5-10 paths probed per competitor host
+                # over one TLS connection instead of one handshake per path
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=64,
+                    max_connections=128,
+                    keepalive_expiry=30.0
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (call on server shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "CompetitorFetchingAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
     
-    def _get_rotated_headers(self) -> Dict[str, str]:
-        """Rotate through headers to avoid detection"""
-        self.request_count += 1
-        header_index = self.request_count % len(self.headers_list)
-        return self.headers_list[header_index]
+    def _get_rotated_headers(self) -> httpx.Headers:
+        """Rotate through pre-encoded headers to avoid detection"""
+        return next(self._headers_cycle)
     
     def get_competitors(self, product: str) -> List[Dict[str, str]]:
         """Fetch competitors for the specified product type."""
@@ -72,33 +208,12 @@ class CompetitorFetchingAgent:
             raise ValueError(f"Unknown product type: {product}. Valid options: {list(PRODUCT_COMPETITORS.keys())}")
         return PRODUCT_COMPETITORS[product]
     
-    def _get_common_paths(self) -> List[str]:
+    def _get_common_paths(self) -> tuple:
         """
         Common paths to try on any competitor website.
         These are generic paths, NOT capability-specific.
         """
-        return [
-            "/help",
-            "/help/",
-            "/support",
-            "/support/",
-            "/docs",
-            "/docs/",
-            "/documentation",
-            "/blog",
-            "/blog/",
-            "/features",
-            "/features/",
-            "/product",
-            "/products",
-            "/resources",
-            "/resources/",
-            "/learn",
-            "/guides",
-            "/faq",
-            "/knowledge-base",
-            "/articles"
-        ]
+        return _COMMON_PATHS
     
     async def discover_help_urls(self, base_url: str, main_page_html: str) -> List[str]:
         """
@@ -106,61 +221,75 @@ class CompetitorFetchingAgent:
         1. First, scrape links from the main page
         2. Then, try common paths on the domain
         """
-        discovered_urls = []
+        discovered_urls: List[str] = []
+        seen: set = set()
         base_url_clean = base_url.rstrip('/')
-        
-        # Extract base domain
-        try:
-            base_domain = base_url_clean.split('//')[1].split('/')[0]
-        except:
-            base_domain = base_url_clean
-        
+        base_domain = urlparse(base_url_clean).netloc or base_url_clean
+
         # Step 1: Try common paths on the base domain
         common_paths = self._get_common_paths()
         for path in common_paths:
             url = f"{base_url_clean}{path}"
-            if url not in discovered_urls:
+            if url not in seen:
+                seen.add(url)
                 discovered_urls.append(url)
-        
+
         # Step 2: Parse links from main page HTML
         if main_page_html:
-            soup = BeautifulSoup(main_page_html, 'lxml')
-            
-            # Keywords that indicate help/documentation pages
-            help_keywords = ['help', 'support', 'docs', 'documentation', 'knowledge', 'faq', 'guide', 'learn', 'resources', 'how-to', 'blog', 'features', 'product']
-            
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                link_text = link.get_text(strip=True).lower()
-                
-                # Check if link text or href contains help keywords
-                is_help_link = any(kw in href.lower() or kw in link_text for kw in help_keywords)
-                
+            for href, get_link_text in self._extract_links(main_page_html):
+                # Check the href first: most matching anchors match on it,
+                # and the text getter walks the anchor's subtree - no point
+                # paying that for login/pricing/cart links that never match
+                is_help_link = bool(_HELP_RE.search(href) or _HELP_RE.search(get_link_text()))
+
                 if is_help_link:
-                    # Normalize the URL
-                    if href.startswith('/'):
-                        full_url = f"https://{base_domain}{href}"
-                    elif href.startswith('http'):
-                        full_url = href
-                    else:
+                    # Normalize relative hrefs against the base URL; skip
+                    # non-http schemes (mailto:, javascript:, etc.)
+                    full_url = urljoin(base_url_clean + '/', href)
+                    if not full_url.startswith('http'):
                         continue
-                    
+
                     # Only include URLs from same domain or known subdomains
-                    if base_domain in full_url or 'help.' in full_url or 'support.' in full_url:
-                        if full_url not in discovered_urls:
+                    link_domain = urlparse(full_url).netloc
+                    if base_domain in link_domain or link_domain.startswith(('help.', 'support.')):
+                        if full_url not in seen:
+                            seen.add(full_url)
                             discovered_urls.append(full_url)
         
         return discovered_urls[:10]  # Return top 10 discovered URLs
+
+    def _extract_links(self, html: str) -> Iterator[tuple]:
+        """
+        Yield (href, lazy text getter) for all anchors - lexbor parser,
+        BS4 fallback. Text is behind a callable so callers that can decide
+        from the href alone never pay for the subtree walk.
+        """
+        try:
+            tree = LexborHTMLParser(html)
+            nodes = tree.css('a[href]')
+        except Exception:
+            soup = BeautifulSoup(html, 'lxml', parse_only=_ANCHOR_STRAINER)
+            for link in soup.find_all('a', href=True):
+                yield (link.get('href', ''), lambda l=link: l.get_text(strip=True).lower())
+            return
+        for node in nodes:
+            yield (node.attributes.get('href') or '', lambda n=node: n.text(strip=True).lower())
     
     def execute(self, product: str) -> Dict[str, Any]:
-        """Execute the competitor fetching operation."""
+        """Execute the competitor fetching operation (TTL-cached per product)."""
+        cached = self._execute_cache.get(product)
+        if cached is not None:
+            return cached
+
         competitors = self.get_competitors(product)
-        return {
+        result = {
             "product": product,
             "competitors": competitors,
             "total_competitors": len(competitors),
             "status": "success"
         }
+        self._execute_cache.set(product, result)
+        return result
     
     def get_competitor_urls(self, product: str) -> List[str]:
         """Get list of competitor URLs for a product"""
@@ -173,33 +302,144 @@ class CompetitorFetchingAgent:
         return [comp["name"] for comp in competitors]
     
     async def _fetch_page(self, url: str, raise_on_error: bool = False, timeout: float = 15.0) -> str:
+        """
+        Fetch HTML content from a URL, serving repeats from a short-TTL cache.
+
+        Uncached fetches are single-flight: concurrent callers for the same
+        URL (e.g. several capabilities probing a competitor's /docs) await
+        one shared in-flight future instead of duplicating the request.
+        Failed fetches are not cached so they can be retried later.
+        """
+        cached = self._page_cache.get(url)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            html = await self._fetch_page_uncached(url, raise_on_error, timeout)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            if html:
+                self._page_cache.set(url, html)
+            future.set_result(html)
+            return html
+        finally:
+            self._inflight.pop(url, None)
+            # A coalesced waiter may never await the future; don't let an
+            # unconsumed exception trip the loop's exception handler
+            if future.done() and future.exception() is not None:
+                future.exception()
+
+    def clear_page_cache(self) -> None:
+        """Drop all cached pages (for long-running servers)."""
+        self._page_cache.clear()
+        self._inflight.clear()
+
+    async def _fetch_page_uncached(self, url: str, raise_on_error: bool = False, timeout: float = 15.0) -> str:
         """Fetch HTML content from a URL with configurable timeout and rotating headers"""
+        host = urlparse(url).netloc
         try:
             headers = self._get_rotated_headers()
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                # Add small delay between requests to be respectful
-                await asyncio.sleep(0.5)
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.text
+            client = self._get_client()
+            for attempt in range(3):
+                async with self._global_sem, self._host_sems[host]:
+                    # Token bucket keeps the per-host rate respectful without
+                    # penalizing requests to other hosts
+                    await self._rate_limiter.acquire(host)
+                    async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                        if response.status_code not in (429, 503) or attempt == 2:
+                            response.raise_for_status()
+
+                            # Only HTML is worth decoding and parsing
+                            content_type = response.headers.get('content-type', '')
+                            if content_type and 'html' not in content_type:
+                                return ""
+
+                            # Stream with a size cap so a pathological page
+                            # can't force a multi-MB decode + parse
+                            chunks = []
+                            total = 0
+                            async for chunk in response.aiter_bytes(65536):
+                                chunks.append(chunk)
+                                total += len(chunk)
+                                if total > _MAX_BODY_BYTES:
+                                    break
+                            return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+                # Server asked us to back off - retry with exponential delay
+                await asyncio.sleep(min(2 ** attempt, 30))
+            return ""
         except httpx.TimeoutException:
-            print(f"[CompetitorAgent] Timeout fetching {url}")
+            logger.warning("[CompetitorAgent] Timeout fetching %s", url)
             if raise_on_error:
                 raise Exception(f"Timeout fetching: {url}")
             return ""
         except Exception as e:
             error_msg = str(e)[:100]
-            print(f"[CompetitorAgent] Error fetching {url}: {error_msg}")
+            logger.warning("[CompetitorAgent] Error fetching %s: %s", url, error_msg)
             if raise_on_error:
                 raise Exception(f"Failed to fetch: {url} - {error_msg}")
             return ""
     
     def _extract_content(self, html: str, url: str) -> Dict[str, Any]:
-        """Extract content from HTML"""
-        if not html:
+        """Extract content from HTML - lexbor parser, BS4/lxml as fallback"""
+        # Don't hand obvious non-HTML (JSON error pages, stub responses) to a
+        # full parser: too small to carry content, or no tag in the head
+        if not html or len(html) < 200 or '<' not in html[:200]:
             return {"url": url, "title": "", "headings": [], "content": "", "keywords_found": []}
-        
-        soup = BeautifulSoup(html, 'lxml')
+
+        try:
+            return self._extract_content_lexbor(html, url)
+        except Exception:
+            return self._extract_content_bs4(html, url)
+
+    def _extract_content_lexbor(self, html: str, url: str) -> Dict[str, Any]:
+        """Extract title/headings/content with selectolax (lexbor) - ~10x faster than BS4"""
+        tree = LexborHTMLParser(html)
+
+        # Remove non-content elements
+        for node in tree.css('script,style,nav,footer,header,aside,noscript'):
+            node.decompose()
+
+        # Extract title
+        title_node = tree.css_first('title')
+        title = title_node.text(strip=True) if title_node else ""
+
+        # Extract headings
+        headings = []
+        for node in tree.css('h1,h2,h3,h4'):
+            text = node.text(strip=True)
+            if text and len(text) > 3:
+                headings.append(text)
+
+        # Extract main content
+        main_area = (
+            tree.css_first('main')
+            or tree.css_first('article')
+            or tree.css_first('div[class*="content" i],div[class*="main" i],div[class*="body" i]')
+        )
+        content_node = main_area if main_area is not None else tree.body
+        content = content_node.text(separator=' ') if content_node is not None else ''
+
+        # Clean content
+        content = ' '.join(content.split())
+
+        return {
+            "url": url,
+            "title": title,
+            "headings": headings[:30],  # Top 30 headings
+            "content": content[:8000]  # First 8000 chars for analysis
+        }
+
+    def _extract_content_bs4(self, html: str, url: str) -> Dict[str, Any]:
+        """Fallback extraction with BeautifulSoup/lxml"""
+        soup = BeautifulSoup(html, 'lxml', parse_only=_CONTENT_STRAINER)
         
         # Remove non-content elements
         for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'meta', 'link', 'noscript']):
@@ -220,7 +460,7 @@ class CompetitorFetchingAgent:
                     headings.append(text)
         
         # Extract main content
-        main_area = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|main|body', re.I))
+        main_area = soup.find('main') or soup.find('article') or soup.find('div', class_=_MAIN_CLASS_RE)
         if main_area:
             content = main_area.get_text(separator=' ', strip=True)
         else:
@@ -238,21 +478,22 @@ class CompetitorFetchingAgent:
     
     async def scrape_competitor_page(self, url: str) -> Dict[str, Any]:
         """Scrape a single competitor page"""
-        print(f"[CompetitorAgent] Scraping: {url}")
+        logger.debug("[CompetitorAgent] Scraping: %s", url)
         html = await self._fetch_page(url)
-        return self._extract_content(html, url)
+        # Parsing is pure CPU - run it in a worker thread so concurrent
+        # fetches aren't stalled behind it on the event loop
+        return await asyncio.to_thread(self._extract_content, html, url)
     
     async def scrape_all_competitors(self, product: str) -> List[Dict[str, Any]]:
-        """Scrape all competitor main pages for a product"""
+        """Scrape all competitor main pages for a product concurrently"""
         competitors = self.get_competitors(product)
-        results = []
-        
-        for comp in competitors:
+
+        async def scrape_one(comp: Dict[str, str]) -> Dict[str, Any]:
             data = await self.scrape_competitor_page(comp["url"])
             data["competitor_name"] = comp["name"]
-            results.append(data)
-        
-        return results
+            return data
+
+        return list(await asyncio.gather(*(scrape_one(comp) for comp in competitors)))
     
     async def search_competitor_for_topic(
         self, 
@@ -264,7 +505,7 @@ class CompetitorFetchingAgent:
         Search a competitor's site for content related to specific terms.
         This uses Google site search or direct page scraping.
         """
-        print(f"[CompetitorAgent] Searching {competitor_name} for: {search_terms[:3]}")
+        logger.info("[CompetitorAgent] Searching %s for: %s", competitor_name, search_terms[:3])
         
         # Build search URLs for different strategies
         search_results = {
@@ -295,22 +536,23 @@ class CompetitorFetchingAgent:
         ]
         
         base_url = competitor_url.rstrip('/')
-        for path in common_paths[:2]:  # Try first 2 paths to avoid too many requests
-            try:
-                test_url = f"{base_url}{path}"
-                html = await self._fetch_page(test_url)
-                if html and len(html) > 1000:
-                    content = self._extract_content(html, test_url)
-                    if content.get("content"):
-                        search_results["pages_found"].append({
-                            "url": test_url,
-                            "title": content.get("title", ""),
-                            "type": "sub_page"
-                        })
-                        search_results["content_extracted"] += " " + content.get("content", "")[:3000]
-                        search_results["headings"] = search_results.get("headings", []) + content.get("headings", [])
-            except Exception as e:
+        test_urls = [f"{base_url}{path}" for path in common_paths[:2]]  # First 2 paths to avoid too many requests
+        htmls = await asyncio.gather(
+            *(self._fetch_page(url) for url in test_urls),
+            return_exceptions=True
+        )
+        for test_url, html in zip(test_urls, htmls):
+            if isinstance(html, Exception) or not html or len(html) <= 1000:
                 continue
+            content = await asyncio.to_thread(self._extract_content, html, test_url)
+            if content.get("content"):
+                search_results["pages_found"].append({
+                    "url": test_url,
+                    "title": content.get("title", ""),
+                    "type": "sub_page"
+                })
+                search_results["content_extracted"] += " " + content.get("content", "")[:3000]
+                search_results["headings"] = search_results.get("headings", []) + content.get("headings", [])
         
         return search_results
     
@@ -328,62 +570,67 @@ class CompetitorFetchingAgent:
         for keyword extraction.
         """
         competitors = self.get_competitors(product)
-        competitor_content = []
-        
-        print(f"\n{'='*70}")
-        print(f"[CompetitorAgent]  COMPETITOR WEBSITE SCRAPING")
-        print(f"{'='*70}")
-        print(f"[CompetitorAgent] Product: {product}")
-        print(f"[CompetitorAgent] Total competitors to scrape: {len(competitors)}")
-        print(f"[CompetitorAgent] Article keywords for matching: {article_keywords[:5]}")
-        print(f"{'='*70}")
-        
-        for idx, comp in enumerate(competitors, 1):
+
+        logger.info("\n%s", '='*70)
+        logger.info("[CompetitorAgent]  COMPETITOR WEBSITE SCRAPING")
+        logger.info("%s", '='*70)
+        logger.info("[CompetitorAgent] Product: %s", product)
+        logger.info("[CompetitorAgent] Total competitors to scrape: %s", len(competitors))
+        logger.info("[CompetitorAgent] Article keywords for matching: %s", article_keywords[:5])
+        logger.info("%s", '='*70)
+        
+        async def scrape_one(comp: Dict[str, str]) -> Dict[str, Any]:
             try:
-                print(f"\n[CompetitorAgent] [{idx}/{len(competitors)}] SCRAPING: {comp['name']}")
-                print(f"[CompetitorAgent]    Main URL: {comp['url']}")
-                
+                logger.info("\n[CompetitorAgent] SCRAPING: %s", comp['name'])
+                logger.debug("[CompetitorAgent]    Main URL: %s", comp['url'])
+
                 # Search competitor site for content related to article keywords
                 content_data = await self.search_competitor_for_topic(
                     competitor_name=comp["name"],
                     competitor_url=comp["url"],
                     search_terms=article_keywords[:5]
                 )
-                
+
                 if content_data.get("content_extracted"):
                     pages_found = content_data.get("pages_found", [])
-                    competitor_content.append({
+                    logger.info("[CompetitorAgent]     SUCCESS (%s): %s chars extracted", comp['name'], len(content_data.get('content_extracted', '')))
+                    logger.info("[CompetitorAgent]     Pages scraped: %s", len(pages_found))
+                    for page in pages_found:
+                        logger.debug("[CompetitorAgent]       - %s: %s", page.get('type', 'page'), page.get('url', ''))
+                    return {
                         "competitor_name": comp["name"],
                         "competitor_url": comp["url"],
                         "content": content_data.get("content_extracted", "")[:6000],
                         "headings": content_data.get("headings", [])[:20],
                         "pages_scraped": len(pages_found),
                         "urls_scraped": [p.get("url") for p in pages_found]
-                    })
-                    print(f"[CompetitorAgent]     SUCCESS: {len(content_data.get('content_extracted', ''))} chars extracted")
-                    print(f"[CompetitorAgent]     Pages scraped: {len(pages_found)}")
-                    for page in pages_found:
-                        print(f"[CompetitorAgent]       - {page.get('type', 'page')}: {page.get('url', '')}")
-                else:
-                    print(f"[CompetitorAgent]     FAILED: No content found")
-                    
+                    }
+
+                logger.warning("[CompetitorAgent]     FAILED (%s): No content found", comp['name'])
+                return None
+
             except Exception as e:
-                print(f"[CompetitorAgent]     ERROR: {e}")
-                continue
-        
+                logger.warning("[CompetitorAgent]     ERROR (%s): %s", comp['name'], e)
+                return None
+
+        # All competitors are independent - scrape them concurrently; the
+        # global/per-host semaphores in _fetch_page cap actual parallelism.
+        scraped = await asyncio.gather(*(scrape_one(comp) for comp in competitors))
+        competitor_content = [r for r in scraped if r]
+
         # Validate that we got content from at least one competitor - NO FALLBACKS
         if len(competitor_content) == 0:
             raise Exception(f"Failed to scrape content from any competitor websites for product: {product}")
         
-        print(f"\n{'='*70}")
-        print(f"[CompetitorAgent]  SCRAPING SUMMARY")
-        print(f"{'='*70}")
-        print(f"[CompetitorAgent] Successfully scraped: {len(competitor_content)}/{len(competitors)} competitors")
+        logger.info("\n%s", '='*70)
+        logger.info("[CompetitorAgent]  SCRAPING SUMMARY")
+        logger.info("%s", '='*70)
+        logger.info("[CompetitorAgent] Successfully scraped: %s/%s competitors", len(competitor_content), len(competitors))
         for comp in competitor_content:
-            print(f"[CompetitorAgent]    {comp['competitor_name']}: {comp['pages_scraped']} pages, {len(comp['content'])} chars")
+            logger.info("[CompetitorAgent]    %s: %s pages, %s chars", comp['competitor_name'], comp['pages_scraped'], len(comp['content']))
             for url in comp.get('urls_scraped', []):
-                print(f"[CompetitorAgent]      URL: {url}")
-        print(f"{'='*70}\n")
+                logger.debug("[CompetitorAgent]      URL: %s", url)
+        logger.info("%s\n", '='*70)
         
         return {
             "product": product,
@@ -404,7 +651,7 @@ class CompetitorFetchingAgent:
         Scrape specific capability-related URLs on a competitor's website.
         Tries each probable URL and extracts content.
         """
-        print(f"\n[CompetitorAgent]  Searching {competitor_name} for: {feature_name}")
+        logger.info("\n[CompetitorAgent]  Searching %s for: %s", competitor_name, feature_name)
         
         result = {
             "competitor_name": competitor_name,
@@ -416,38 +663,44 @@ class CompetitorFetchingAgent:
             "terminology_found": []
         }
         
-        for url in probable_urls[:5]:  # Try up to 5 URLs
-            try:
-                print(f"[CompetitorAgent]    Trying: {url}")
-                html = await self._fetch_page(url)
-                
-                if html and len(html) > 500:
-                    content_data = self._extract_content(html, url)
-                    
-                    if content_data.get("content") and len(content_data.get("content", "")) > 200:
-                        result["urls_tried"].append({"url": url, "status": "success"})
-                        result["urls_successful"].append(url)
-                        result["content_extracted"] += f"\n\n=== FROM {url} ===\n" + content_data.get("content", "")[:4000]
-                        result["headings"].extend(content_data.get("headings", []))
-                        print(f"[CompetitorAgent]     Found: {len(content_data.get('content', ''))} chars")
-                    else:
-                        result["urls_tried"].append({"url": url, "status": "no_content"})
-                        print(f"[CompetitorAgent]    ️ Page exists but no relevant content")
-                else:
-                    result["urls_tried"].append({"url": url, "status": "empty"})
-                    print(f"[CompetitorAgent]     Empty or failed")
-                    
-            except Exception as e:
-                result["urls_tried"].append({"url": url, "status": f"error: {str(e)[:50]}"})
-                print(f"[CompetitorAgent]     Error: {str(e)[:50]}")
+        # The candidate URLs are independent - fetch them concurrently (the
+        # per-host semaphore/rate limiter keeps us polite), then extract
+        # sequentially since extraction is pure CPU.
+        urls_to_try = probable_urls[:5]  # Try up to 5 URLs
+        logger.debug("[CompetitorAgent]    Trying %s URLs concurrently...", len(urls_to_try))
+        htmls = await asyncio.gather(
+            *(self._fetch_page(url) for url in urls_to_try),
+            return_exceptions=True
+        )
+
+        for url, html in zip(urls_to_try, htmls):
+            if isinstance(html, Exception):
+                result["urls_tried"].append({"url": url, "status": f"error: {str(html)[:50]}"})
+                logger.warning("[CompetitorAgent]     Error: %s", str(html)[:50])
                 continue
+
+            if html and len(html) > 500:
+                content_data = await asyncio.to_thread(self._extract_content, html, url)
+
+                if content_data.get("content") and len(content_data.get("content", "")) > 200:
+                    result["urls_tried"].append({"url": url, "status": "success"})
+                    result["urls_successful"].append(url)
+                    result["content_extracted"] += f"\n\n=== FROM {url} ===\n" + content_data.get("content", "")[:4000]
+                    result["headings"].extend(content_data.get("headings", []))
+                    logger.debug("[CompetitorAgent]     Found: %s chars", len(content_data.get('content', '')))
+                else:
+                    result["urls_tried"].append({"url": url, "status": "no_content"})
+                    logger.debug("[CompetitorAgent]    ️ Page exists but no relevant content")
+            else:
+                result["urls_tried"].append({"url": url, "status": "empty"})
+                logger.debug("[CompetitorAgent]     Empty or failed")
         
         # If no specific URLs worked, try the base URL
         if not result["urls_successful"]:
-            print(f"[CompetitorAgent]    Falling back to base URL: {competitor_base_url}")
+            logger.debug("[CompetitorAgent]    Falling back to base URL: %s", competitor_base_url)
             html = await self._fetch_page(competitor_base_url)
             if html:
-                content_data = self._extract_content(html, competitor_base_url)
+                content_data = await asyncio.to_thread(self._extract_content, html, competitor_base_url)
                 if content_data.get("content"):
                     result["urls_successful"].append(competitor_base_url)
                     result["content_extracted"] = content_data.get("content", "")[:5000]
@@ -455,6 +708,100 @@ class CompetitorFetchingAgent:
         
         return result
     
+    async def _scrape_competitor_capability(
+        self,
+        comp: Dict[str, str],
+        capability: dict,
+        llm_client
+    ) -> Dict[str, Any]:
+        """
+        Scrape one competitor for capability-specific content.
+        Returns the content dict, or None if nothing usable was found.
+        """
+        capability_name = capability.get('name', 'Unknown')
+
+        logger.info("\n[CompetitorAgent] %s", comp['name'])
+        logger.info("[CompetitorAgent]    Base URL: %s", comp['url'])
+
+        # Step 1: Scrape main page to discover help/docs URLs dynamically
+        main_html = await self._fetch_page(comp['url'], timeout=12.0)
+        main_content = await asyncio.to_thread(self._extract_content, main_html, comp['url']) if main_html else {}
+
+        fallback_content = main_content.get('content', '')
+        fallback_headings = main_content.get('headings', [])
+
+        # Step 2: Dynamically discover help/documentation URLs from main page
+        discovered_help_urls = await self.discover_help_urls(comp['url'], main_html) if main_html else []
+        if discovered_help_urls:
+            logger.debug("[CompetitorAgent]     Discovered %s help URLs dynamically", len(discovered_help_urls))
+
+        # Step 3: Use LLM to find capability-specific URLs
+        try:
+            logger.debug("[CompetitorAgent]     Using LLM to find '%s' URLs...", capability_name)
+            async with self._llm_sem:
+                competitor_capability = await llm_client.find_competitor_capability_urls(
+                    capability=capability,
+                    competitor_name=comp['name'],
+                    competitor_base_url=comp['url'],
+                    competitor_content=fallback_content[:1500]
+                )
+
+            if competitor_capability:
+                likely_feature_name = competitor_capability.get('likely_feature_name', capability_name)
+                llm_urls = competitor_capability.get('probable_urls', [])
+                terminology_hints = competitor_capability.get('terminology_hints', [])
+
+                logger.debug("[CompetitorAgent]     %s calls it: '%s'", comp['name'], likely_feature_name)
+
+                # Combine LLM-generated URLs with dynamically discovered help
+                # URLs, deduped in one pass with insertion order preserved
+                unique_urls = list(dict.fromkeys(llm_urls + discovered_help_urls))
+
+                logger.debug("[CompetitorAgent]     Total URLs to try: %s", len(unique_urls))
+
+                # Try to scrape the URLs
+                scrape_result = await self.scrape_capability_specific_urls(
+                    competitor_name=comp['name'],
+                    competitor_base_url=comp['url'],
+                    probable_urls=unique_urls,
+                    feature_name=likely_feature_name
+                )
+
+                if scrape_result.get("content_extracted"):
+                    logger.info("[CompetitorAgent]     SUCCESS: %s chars", len(scrape_result.get('content_extracted', '')))
+                    return {
+                        "competitor_name": comp['name'],
+                        "competitor_url": comp['url'],
+                        "capability_name": capability_name,
+                        "competitor_feature_name": likely_feature_name,
+                        "urls_scraped": scrape_result.get("urls_successful", []),
+                        "content": scrape_result.get("content_extracted", "")[:8000],
+                        "headings": scrape_result.get("headings", [])[:30],
+                        "terminology_hints": terminology_hints,
+                        "pages_scraped": len(scrape_result.get("urls_successful", []))
+                    }
+
+        except Exception as llm_error:
+            logger.warning("[CompetitorAgent]    ️ LLM error: %s", str(llm_error)[:50])
+
+        # Fallback: use main page content if available
+        if fallback_content and len(fallback_content) > 200:
+            logger.info("[CompetitorAgent]     Fallback: %s chars from main page", len(fallback_content))
+            return {
+                "competitor_name": comp['name'],
+                "competitor_url": comp['url'],
+                "capability_name": capability_name,
+                "competitor_feature_name": capability_name,
+                "urls_scraped": [comp['url']],
+                "content": fallback_content[:6000],
+                "headings": fallback_headings[:20],
+                "terminology_hints": [],
+                "pages_scraped": 1
+            }
+
+        logger.info("[CompetitorAgent]     No content found for %s", comp['name'])
+        return None
+
     async def get_competitor_content_for_capability(
         self,
         product: str,
@@ -463,132 +810,63 @@ class CompetitorFetchingAgent:
     ) -> Dict[str, Any]:
         """
         DYNAMIC capability-based competitor scraping.
-        
+
         1. For each competitor, use LLM to find equivalent capability URLs
         2. Scrape those specific URLs
         3. Extract terminology and content
-        
-        This is fully dynamic - no hardcoded paths.
+
+        Competitors are scraped concurrently (bounded by a semaphore) since
+        each one is independent network-bound work.
         """
         competitors = self.get_competitors(product)
-        competitor_content = []
-        
+
         capability_name = capability.get('name', 'Unknown')
         search_terms = capability.get('competitor_search_terms', [])
-        
-        print(f"\n{'='*70}")
-        print(f"[CompetitorAgent]  DYNAMIC CAPABILITY-BASED SCRAPING")
-        print(f"{'='*70}")
-        print(f"[CompetitorAgent] Capability: {capability_name}")
-        print(f"[CompetitorAgent] Description: {capability.get('description', '')}")
-        print(f"[CompetitorAgent] Search Terms: {search_terms}")
-        print(f"[CompetitorAgent] Competitors to search: {len(competitors)}")
-        print(f"{'='*70}")
-        
-        # Process all competitors
-        for idx, comp in enumerate(competitors, 1):
-            try:
-                print(f"\n[CompetitorAgent] [{idx}/{len(competitors)}] {comp['name']}")
-                print(f"[CompetitorAgent]    Base URL: {comp['url']}")
-                
-                # Step 1: Scrape main page to discover help/docs URLs dynamically
-                main_html = await self._fetch_page(comp['url'], timeout=12.0)
-                main_content = self._extract_content(main_html, comp['url']) if main_html else {}
-                
-                fallback_content = main_content.get('content', '')
-                fallback_headings = main_content.get('headings', [])
-                
-                # Step 2: Dynamically discover help/documentation URLs from main page
-                discovered_help_urls = await self.discover_help_urls(comp['url'], main_html) if main_html else []
-                if discovered_help_urls:
-                    print(f"[CompetitorAgent]     Discovered {len(discovered_help_urls)} help URLs dynamically")
-                
-                # Step 3: Use LLM to find capability-specific URLs
+
+        logger.info("\n%s", '='*70)
+        logger.info("[CompetitorAgent]  DYNAMIC CAPABILITY-BASED SCRAPING")
+        logger.info("%s", '='*70)
+        logger.info("[CompetitorAgent] Capability: %s", capability_name)
+        logger.info("[CompetitorAgent] Description: %s", capability.get('description', ''))
+        logger.info("[CompetitorAgent] Search Terms: %s", search_terms)
+        logger.info("[CompetitorAgent] Competitors to search: %s", len(competitors))
+        logger.info("%s", '='*70)
+
+        # Process all competitors concurrently, capped so we don't hammer
+        # the network (or our own event loop) with too many parallel scrapes.
+        semaphore = asyncio.Semaphore(8)
+
+        async def scrape_with_limit(comp: Dict[str, str]):
+            async with semaphore:
                 try:
-                    print(f"[CompetitorAgent]     Using LLM to find '{capability_name}' URLs...")
-                    competitor_capability = await llm_client.find_competitor_capability_urls(
-                        capability=capability,
-                        competitor_name=comp['name'],
-                        competitor_base_url=comp['url'],
-                        competitor_content=fallback_content[:1500]
-                    )
-                    
-                    if competitor_capability:
-                        likely_feature_name = competitor_capability.get('likely_feature_name', capability_name)
-                        llm_urls = competitor_capability.get('probable_urls', [])
-                        terminology_hints = competitor_capability.get('terminology_hints', [])
-                        
-                        print(f"[CompetitorAgent]     {comp['name']} calls it: '{likely_feature_name}'")
-                        
-                        # Combine LLM-generated URLs with dynamically discovered help URLs
-                        all_urls_to_try = llm_urls + discovered_help_urls
-                        # Remove duplicates while preserving order
-                        seen = set()
-                        unique_urls = []
-                        for url in all_urls_to_try:
-                            if url not in seen:
-                                seen.add(url)
-                                unique_urls.append(url)
-                        
-                        print(f"[CompetitorAgent]     Total URLs to try: {len(unique_urls)}")
-                        
-                        # Try to scrape the URLs
-                        scrape_result = await self.scrape_capability_specific_urls(
-                            competitor_name=comp['name'],
-                            competitor_base_url=comp['url'],
-                            probable_urls=unique_urls,
-                            feature_name=likely_feature_name
-                        )
-                        
-                        if scrape_result.get("content_extracted"):
-                            competitor_content.append({
-                                "competitor_name": comp['name'],
-                                "competitor_url": comp['url'],
-                                "capability_name": capability_name,
-                                "competitor_feature_name": likely_feature_name,
-                                "urls_scraped": scrape_result.get("urls_successful", []),
-                                "content": scrape_result.get("content_extracted", "")[:8000],
-                                "headings": scrape_result.get("headings", [])[:30],
-                                "terminology_hints": terminology_hints,
-                                "pages_scraped": len(scrape_result.get("urls_successful", []))
-                            })
-                            print(f"[CompetitorAgent]     SUCCESS: {len(scrape_result.get('content_extracted', ''))} chars")
-                            continue  # Move to next competitor
-                
-                except Exception as llm_error:
-                    print(f"[CompetitorAgent]    ️ LLM error: {str(llm_error)[:50]}")
-                
-                # Fallback: use main page content if available
-                if fallback_content and len(fallback_content) > 200:
-                    print(f"[CompetitorAgent]     Using main page content as fallback")
-                    competitor_content.append({
-                        "competitor_name": comp['name'],
-                        "competitor_url": comp['url'],
-                        "capability_name": capability_name,
-                        "competitor_feature_name": capability_name,
-                        "urls_scraped": [comp['url']],
-                        "content": fallback_content[:6000],
-                        "headings": fallback_headings[:20],
-                        "terminology_hints": [],
-                        "pages_scraped": 1
-                    })
-                    print(f"[CompetitorAgent]     Fallback: {len(fallback_content)} chars from main page")
-                else:
-                    print(f"[CompetitorAgent]     No content found for {comp['name']}")
-                    
-            except Exception as e:
-                print(f"[CompetitorAgent]     ERROR: {str(e)[:100]}")
-                continue
-        
+                    return await self._scrape_competitor_capability(comp, capability, llm_client)
+                except Exception as e:
+                    logger.warning("[CompetitorAgent]     ERROR (%s): %s", comp['name'], str(e)[:100])
+                    return None
+
+        # as_completed surfaces each competitor's result the moment it
+        # finishes, so progress shows up while slow sites are still fetching
+        # instead of after the slowest one completes.
+        competitor_content = []
+        done_count = 0
+        for future in asyncio.as_completed([scrape_with_limit(comp) for comp in competitors]):
+            result = await future
+            done_count += 1
+            if result:
+                competitor_content.append(result)
+                logger.info("[CompetitorAgent]  [%s/%s] %s: %s chars", done_count, len(competitors), result['competitor_name'], len(result.get('content', '')))
+            else:
+                logger.info("[CompetitorAgent]  [%s/%s] no capability content", done_count, len(competitors))
+
         # If dynamic capability search failed for all, fall back to main page scraping
         if len(competitor_content) == 0:
-            print(f"\n[CompetitorAgent] ️ Dynamic capability search failed, falling back to main page scraping...")
+            logger.warning("\n[CompetitorAgent] ️ Dynamic capability search failed, falling back to main page scraping...")
             
             for comp in competitors:
                 try:
                     html = await self._fetch_page(comp['url'])
                     if html:
-                        content_data = self._extract_content(html, comp['url'])
+                        content_data = await asyncio.to_thread(self._extract_content, html, comp['url'])
                         if content_data.get("content") and len(content_data.get("content", "")) > 200:
                             competitor_content.append({
                                 "competitor_name": comp['name'],
@@ -601,27 +879,27 @@ class CompetitorFetchingAgent:
                                 "terminology_hints": [],
                                 "pages_scraped": 1
                             })
-                            print(f"[CompetitorAgent]     Fallback success for {comp['name']}")
+                            logger.info("[CompetitorAgent]     Fallback success for %s", comp['name'])
                 except Exception as e:
-                    print(f"[CompetitorAgent]     Fallback failed for {comp['name']}: {e}")
+                    logger.warning("[CompetitorAgent]     Fallback failed for %s: %s", comp['name'], e)
                     continue
         
         # Final validation
         if len(competitor_content) == 0:
             raise Exception(f"Failed to scrape any competitor content for capability '{capability_name}'")
         
-        print(f"\n{'='*70}")
-        print(f"[CompetitorAgent]  CAPABILITY SCRAPING SUMMARY")
-        print(f"{'='*70}")
-        print(f"[CompetitorAgent] Capability: {capability_name}")
-        print(f"[CompetitorAgent] Competitors processed: {len(competitors)}")
-        print(f"[CompetitorAgent] Successfully found on: {len(competitor_content)} competitors")
+        logger.info("\n%s", '='*70)
+        logger.info("[CompetitorAgent]  CAPABILITY SCRAPING SUMMARY")
+        logger.info("%s", '='*70)
+        logger.info("[CompetitorAgent] Capability: %s", capability_name)
+        logger.info("[CompetitorAgent] Competitors processed: %s", len(competitors))
+        logger.info("[CompetitorAgent] Successfully found on: %s competitors", len(competitor_content))
         for comp in competitor_content:
-            print(f"[CompetitorAgent]    {comp['competitor_name']}: '{comp['competitor_feature_name']}'")
-            print(f"[CompetitorAgent]     Content: {len(comp['content'])} chars from {comp['pages_scraped']} pages")
+            logger.info("[CompetitorAgent]    %s: '%s'", comp['competitor_name'], comp['competitor_feature_name'])
+            logger.info("[CompetitorAgent]     Content: %s chars from %s pages", len(comp['content']), comp['pages_scraped'])
             for url in comp.get('urls_scraped', []):
-                print(f"[CompetitorAgent]     URL: {url}")
-        print(f"{'='*70}\n")
+                logger.debug("[CompetitorAgent]     URL: %s", url)
+        logger.info("%s\n", '='*70)
         
         return {
             "product": product,
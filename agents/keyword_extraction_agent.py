@@ -5,16 +5,14 @@ Responsible for extracting keywords from URLs using web scraping and AI analysis
 Agent 2 in the SEO Agent System.
 """
 
+import asyncio
 from typing import List, Dict, Any
-from datetime import datetime
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from backend.cache import iso_now
 from backend.scraper import scraper
 from backend.llm_client import llm_client
 from backend.semrush import semrush_analyzer
+from backend.extraction_cache import content_fingerprint, get_extraction_cache
 
 
 class KeywordExtractionAgent:
@@ -32,6 +30,8 @@ class KeywordExtractionAgent:
         self.scraper = scraper
         self.llm_client = llm_client
         self.semrush = semrush_analyzer
+        # Disk-backed, opt-in via SEO_CACHE_DIR; None disables caching
+        self.extraction_cache = get_extraction_cache()
     
     async def scrape_url(self, url: str) -> Dict[str, Any]:
         """
@@ -87,6 +87,68 @@ class KeywordExtractionAgent:
         print(f"[KeywordExtractionAgent] Extracted {len(keywords)} article keywords")
         return keywords
     
+    async def full_extraction_batch(
+        self,
+        urls: List[str],
+        time_range: str = "month",
+        max_keywords: int = 10,
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Run full_extraction over several URLs concurrently.
+
+        Each URL is independent scrape+LLM work, so fanning out under a
+        bounded semaphore gives near-linear speedup up to the concurrency
+        cap. Failures are reported per URL instead of failing the batch.
+
+        When the disk cache is configured, all URLs are scraped up front
+        (the scraper memoizes, so misses reuse these fetches), cached
+        extractions are recalled in a single get_many() batch off the
+        event loop, and only the misses fan out to full_extraction.
+        """
+        semaphore = asyncio.BoundedSemaphore(max_concurrency)
+
+        async def extract_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.full_extraction(url, time_range, max_keywords)
+                except Exception as e:
+                    return {"status": "error", "url": url, "error": str(e)}
+
+        if self.extraction_cache is None:
+            return list(await asyncio.gather(*(extract_one(url) for url in urls)))
+
+        async def resolve_key(url: str) -> str:
+            async with semaphore:
+                try:
+                    scraped = await self.scrape_url(url)
+                except Exception:
+                    # Let full_extraction retry and report the scrape error
+                    return None
+            fingerprint = content_fingerprint(scraped["title"], scraped["content"])
+            return self.extraction_cache.make_key(url, time_range, fingerprint)
+
+        keys = await asyncio.gather(*(resolve_key(url) for url in urls))
+        resolved = [key for key in keys if key is not None]
+        hits = dict(zip(resolved, await self.extraction_cache.get_many(resolved)))
+
+        results: List[Dict[str, Any]] = [None] * len(urls)
+        pending = []
+        for i, (url, key) in enumerate(zip(urls, keys)):
+            payload = hits.get(key) if key is not None else None
+            if payload is not None:
+                print(f"[KeywordExtractionAgent] Serving cached extraction for: {url}")
+                results[i] = payload
+            else:
+                pending.append(i)
+
+        if pending:
+            outcomes = await asyncio.gather(*(extract_one(urls[i]) for i in pending))
+            for i, outcome in zip(pending, outcomes):
+                results[i] = outcome
+
+        return results
+
     async def full_extraction(
         self,
         url: str,
@@ -99,7 +161,18 @@ class KeywordExtractionAgent:
         try:
             # Step 1: Scrape
             scraped = await self.scrape_url(url)
-            
+
+            # Results are deterministic for fixed (url, scraped content,
+            # prompt version) - serve repeats from disk when configured
+            cache_key = None
+            if self.extraction_cache is not None:
+                fingerprint = content_fingerprint(scraped["title"], scraped["content"])
+                cache_key = self.extraction_cache.make_key(url, time_range, fingerprint)
+                cached = self.extraction_cache.get(cache_key)
+                if cached is not None:
+                    print(f"[KeywordExtractionAgent] Serving cached extraction for: {url}")
+                    return cached
+
             # Step 2: Extract keywords
             keywords = await self.extract_article_keywords(
                 title=scraped["title"],
@@ -109,7 +182,7 @@ class KeywordExtractionAgent:
                 time_range=time_range
             )
             
-            return {
+            result = {
                 "status": "success",
                 "url": url,
                 "title": scraped["title"],
@@ -117,8 +190,13 @@ class KeywordExtractionAgent:
                 "keywords": keywords[:max_keywords],
                 "total_extracted": len(keywords[:max_keywords]),
                 "time_range": time_range,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": iso_now()
             }
+
+            if cache_key is not None:
+                self.extraction_cache.set(cache_key, result)
+
+            return result
             
         except Exception as e:
             raise Exception(f"Keyword extraction failed: {str(e)}")
@@ -1,9 +1,32 @@
 """
 SEO Agent Backend Module
+
+Submodule singletons (LLM client, scraper, SEMrush analyzer) are loaded
+lazily via PEP 562 __getattr__ so `import backend` stays cheap for callers
+that only need config - each singleton eagerly builds its own state.
 """
 
-from .config import *
-from .llm_client import llm_client, AzureOpenAIClient
-from .scraper import scraper, WebScraper
-from .semrush import semrush_analyzer, SEMrushAnalyzer
+import importlib
+
+# Attribute name -> (module, attribute) resolved on first access
+_LAZY = {
+    "llm_client": ("backend.llm_client", "llm_client"),
+    "AzureOpenAIClient": ("backend.llm_client", "AzureOpenAIClient"),
+    "scraper": ("backend.scraper", "scraper"),
+    "WebScraper": ("backend.scraper", "WebScraper"),
+    "semrush_analyzer": ("backend.semrush", "semrush_analyzer"),
+    "SEMrushAnalyzer": ("backend.semrush", "SEMrushAnalyzer"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
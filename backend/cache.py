@@ -0,0 +1,87 @@
+"""
+Lightweight in-process caching for the SEO Agent
+
+Provides a TTL-bounded LRU cache and a helper for building stable cache keys
+from request inputs. Used to skip repeated LLM calls and scrapes when the
+same article/product is analyzed more than once.
+"""
+
+import hashlib
+import json
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional
+
+# (monotonic time, formatted timestamp) of the last iso_now() computation
+_last_iso = (0.0, "")
+
+
+def iso_now() -> str:
+    """
+    Current local time as an ISO string, cached for 0.25s.
+
+    Response timestamps don't need sub-second precision, and
+    datetime.now().isoformat() costs a syscall plus formatting on every
+    call - noticeable at high request rates.
+    """
+    global _last_iso
+    now = time.monotonic()
+    if now - _last_iso[0] < 0.25:
+        return _last_iso[1]
+    formatted = datetime.now().isoformat()
+    _last_iso = (now, formatted)
+    return formatted
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable SHA256 cache key from arbitrary JSON-serializable parts.
+    Dict keys are sorted so logically-equal inputs produce the same key.
+
+    orjson serializes straight to bytes, skipping the intermediate str and
+    its utf-8 re-encode - keys are built from full article content, so the
+    saved copy is the size of the article.
+    """
+    if orjson is not None:
+        serialized = orjson.dumps(list(parts), option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        serialized = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(serialized).hexdigest()
+
+
+class TTLCache:
+    """Simple LRU cache where entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._store: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None if missing/expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        if time.monotonic() - timestamp > self.ttl:
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry if the cache is full."""
+        if key in self._store:
+            self._store.move_to_end(key)
+        self._store[key] = (time.monotonic(), value)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        self._store.clear()
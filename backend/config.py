@@ -3,37 +3,84 @@ Configuration settings for the SEO Agent
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import quote_plus
 
-# Azure OpenAI Configuration
-AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "https://forms-azure-openai-stg.openai.azure.com")
-AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
-AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01")
-AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY", "Your-Key")
 
-# LLM Provider
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", "azure")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Typed, immutable runtime settings, read from the environment once.
+
+    A frozen dataclass instead of loose module globals: fields are typed
+    (server_port and max_input_tokens parse to int at load, not at first
+    use), the bundle can't be mutated at runtime, and tests can build a
+    Settings with overrides instead of patching the environment.
+    """
+    azure_openai_endpoint: str
+    azure_openai_deployment_name: str
+    azure_openai_api_version: str
+    azure_openai_api_key: str
+    llm_provider: str
+    max_input_tokens: int
+    server_host: str
+    server_port: int
+
+
+def _load_settings() -> Settings:
+    env = os.environ
+    return Settings(
+        azure_openai_endpoint=env.get("AZURE_OPENAI_ENDPOINT", "https://forms-azure-openai-stg.openai.azure.com"),
+        azure_openai_deployment_name=env.get("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
+        azure_openai_api_version=env.get("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+        azure_openai_api_key=env.get("AZURE_OPENAI_API_KEY", "Your-Key"),
+        llm_provider=env.get("LLM_PROVIDER", "azure"),
+        # Default matches the previous flat 4000-char truncation (~4 chars/token)
+        max_input_tokens=int(env.get("SEO_MAX_INPUT_TOKENS", "1000")),
+        server_host=env.get("SERVER_HOST", "127.0.0.1"),
+        server_port=int(env.get("SERVER_PORT", "8000")),
+    )
+
+
+settings = _load_settings()
+
+# Backward-compatible module-level aliases
+AZURE_OPENAI_ENDPOINT = settings.azure_openai_endpoint
+AZURE_OPENAI_DEPLOYMENT_NAME = settings.azure_openai_deployment_name
+AZURE_OPENAI_API_VERSION = settings.azure_openai_api_version
+AZURE_OPENAI_API_KEY = settings.azure_openai_api_key
+LLM_PROVIDER = settings.llm_provider
 
 # Product-specific competitor configurations
-# Only basic info - all URLs are discovered dynamically
+# Only basic info - all URLs are discovered dynamically.
+# Tuples rather than lists: this is read-only reference data shared across
+# agents, and tuples keep accidental mutation out and the footprint down.
 PRODUCT_COMPETITORS = {
-    "Assets": [
+    "Assets": (
         {"name": "Bynder", "url": "https://www.bynder.com/"},
         {"name": "Brandfolder", "url": "https://brandfolder.com/"},
         {"name": "Canto", "url": "https://www.canto.com/"},
         {"name": "Widen", "url": "https://www.widen.com/"}
-    ],
-    "Forms": [
+    ),
+    "Forms": (
         {"name": "Typeform", "url": "https://www.typeform.com/"},
         {"name": "Jotform", "url": "https://www.jotform.com/"},
         {"name": "Formstack", "url": "https://www.formstack.com/"},
         {"name": "Wufoo", "url": "https://www.wufoo.com/"}
-    ],
-    "Sites": [
+    ),
+    "Sites": (
         {"name": "Wix", "url": "https://www.wix.com/"},
         {"name": "Squarespace", "url": "https://www.squarespace.com/"},
         {"name": "Webflow", "url": "https://webflow.com/"},
         {"name": "WordPress", "url": "https://wordpress.com/"}
-    ]
+    )
+}
+
+# Precomputed name lookup so callers don't linear-scan the tuples
+COMPETITORS_BY_NAME = {
+    product: {c["name"]: c for c in competitors}
+    for product, competitors in PRODUCT_COMPETITORS.items()
 }
 
 
@@ -43,7 +90,16 @@ COMPETITORS = PRODUCT_COMPETITORS["Forms"]
 # SEMrush base URL format
 SEMRUSH_URL_TEMPLATE = "https://www.semrush.com/analytics/keywordmagic/?q={keyword}&db=us"
 
+
+@lru_cache(maxsize=4096)
+def make_semrush_url(keyword: str) -> str:
+    """SEMrush research URL for a keyword, cached per unique keyword."""
+    return SEMRUSH_URL_TEMPLATE.format(keyword=quote_plus(keyword))
+
+# Max prompt tokens of article content sent to keyword extraction
+MAX_INPUT_TOKENS = settings.max_input_tokens
+
 # Server settings
-SERVER_HOST = "127.0.0.1"
-SERVER_PORT = 8000
+SERVER_HOST = settings.server_host
+SERVER_PORT = settings.server_port
 
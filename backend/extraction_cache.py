@@ -0,0 +1,122 @@
+"""
+Disk-backed cache for keyword extraction results
+
+Extraction output is deterministic for a fixed (url, scraped content,
+prompt version), so repeat extractions of the same URL can skip both the
+scrape-dependent LLM call and its latency entirely. Records are stored as
+plain JSON files - one per key - which doubles as a replayable audit trail.
+
+Opt-in: set the SEO_CACHE_DIR environment variable to a writable directory.
+Without it, get_extraction_cache() returns None and callers skip caching.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from backend.cache import make_cache_key
+
+# Bump when the extraction prompt or payload shape changes so stale records
+# are not replayed against new expectations
+PROMPT_VERSION = "v1"
+
+# Fields a cached payload must carry to be served; anything else is treated
+# as a corrupt/outdated record and evicted
+_REQUIRED_FIELDS = ("status", "url", "title", "content", "keywords")
+
+
+def content_fingerprint(title: str, content: str) -> str:
+    """
+    SHA256 over length-prefixed title + content.
+
+    The 8-byte length prefixes keep ("ab", "c") and ("a", "bc") from
+    colliding the way plain concatenation would.
+    """
+    hasher = hashlib.sha256()
+    for part in (title, content):
+        data = part.encode('utf-8')
+        hasher.update(len(data).to_bytes(8, 'little'))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+class ExtractionCache:
+    """Stores extraction payloads as one JSON file per cache key."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, url: str, time_range: str, fingerprint: str) -> str:
+        return make_cache_key("extraction", PROMPT_VERSION, url, time_range, fingerprint)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload, or None on miss.
+
+        Records that fail to parse or are missing required fields are
+        evicted so the caller falls through to a live extraction.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            payload = record["payload"]
+            if not all(field in payload for field in _REQUIRED_FIELDS):
+                raise ValueError("missing required fields")
+            return payload
+        except FileNotFoundError:
+            return None
+        except Exception:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read several cached payloads concurrently.
+
+        Each get() is blocking open+read+parse; batch recalls (e.g. the
+        batch extraction endpoint) run them in worker threads so the event
+        loop isn't stalled on N serialized file reads. Results align with
+        the input keys; misses are None.
+        """
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.get, key) for key in keys)
+        ))
+
+    def set(self, key: str, payload: Dict[str, Any]) -> None:
+        """Persist a payload atomically (write to temp file, then rename)."""
+        record = {
+            "payload": payload,
+            "prompt_version": PROMPT_VERSION,
+            "timestamp_utc": datetime.now(timezone.utc).isoformat()
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Caching is best-effort; a full disk shouldn't fail the request
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Return the shared cache if SEO_CACHE_DIR is configured, else None."""
+    cache_dir = os.environ.get("SEO_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return ExtractionCache(cache_dir)
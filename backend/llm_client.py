@@ -6,18 +6,30 @@ Suggested keywords = Top 10 high-volume relevant keywords from BOTH article and
 Each keyword includes: CPC, difficulty level, tool used, competitor names
 """
 
+import asyncio
 import httpx
 import json
-from typing import List
+import logging
+import orjson
+import os
+import random
+import re
+from functools import lru_cache
+from typing import List, Optional
 
+from backend.cache import TTLCache, make_cache_key
+from backend.token_budget import budget_content
 from backend.config import (
     AZURE_OPENAI_ENDPOINT,
     AZURE_OPENAI_DEPLOYMENT_NAME,
     AZURE_OPENAI_API_VERSION,
     AZURE_OPENAI_API_KEY,
-    SEMRUSH_URL_TEMPLATE,
-    PRODUCT_COMPETITORS
+    PRODUCT_COMPETITORS,
+    make_semrush_url
 )
+from backend.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Product names to exclude from keywords
 EXCLUDED_PRODUCT_TERMS = [
@@ -31,6 +43,249 @@ EXCLUDED_PRODUCT_TERMS = [
     "aem"
 ]
 
+# One alternation over all product terms: a single scan of the keyword
+# replaces the per-term Python substring loop in the hot filtering path
+_EXCLUDED_TERMS_RE = re.compile('|'.join(map(re.escape, EXCLUDED_PRODUCT_TERMS)))
+
+# Sentence boundary used when chunking content for section-by-section rewriting
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n{2,}')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# "Section X of Y" / "Chunk X of Y" markers the LLM sometimes echoes back
+_SECTION_MARKER_RE = re.compile(r'(?i)section\s+\d+\s+(?:of|/)\s+\d+:?\s*')
+_CHUNK_MARKER_RE = re.compile(r'(?i)chunk\s+\d+\s+(?:of|/)\s+\d+:?\s*')
+
+# time_range -> response volume field; built once instead of per call
+_VOLUME_FIELDS = {
+    "week": "weekly_volume",
+    "year": "yearly_volume",
+    "month": "monthly_volume"
+}
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(response: str) -> dict:
+    """
+    Parse the first JSON object embedded in an LLM response.
+
+    Fast path: orjson on the find/rfind slice. When trailing prose after
+    the object (or a stray brace in it) breaks that slice, raw_decode
+    parses exactly one object from the first '{' and ignores the rest
+    instead of failing the whole response.
+
+    Raises ValueError when no parseable object exists.
+    """
+    idx = response.find('{')
+    if idx < 0:
+        raise ValueError("no JSON object in response")
+    end = response.rfind('}') + 1
+    if end > idx:
+        try:
+            return orjson.loads(response[idx:end])
+        except orjson.JSONDecodeError:
+            pass
+    obj, _ = _JSON_DECODER.raw_decode(response, idx)
+    return obj
+
+
+def _require_fields(obj: Optional[dict], fields: tuple, what: str) -> dict:
+    """
+    Assert obj is a dict carrying non-None values for every field.
+
+    One shared shape check instead of ad-hoc chained .get() tests per
+    parser; the raised message names the missing field so the
+    retry-with-feedback loop can tell the model exactly what to fix.
+    """
+    if not isinstance(obj, dict):
+        raise Exception(f"{what}: expected a JSON object")
+    for field in fields:
+        if obj.get(field) is None:
+            raise Exception(f"{what}: missing required field '{field}'")
+    return obj
+
+
+# System prompts built once instead of per call. The static instructions
+# live verbatim in the system message and only per-call data goes in the
+# user message: an identical, pre-materialized prefix costs nothing to
+# reuse here and lets Azure's prompt caching skip re-processing it.
+_CAPABILITY_SYSTEM_PROMPT = """You are a product analyst expert at understanding technical documentation and product features.
+
+TASK: Analyze the article the user provides and identify:
+1. What is the MAIN CAPABILITY or FEATURE this article is about?
+2. What would this capability be called on competitor websites?
+3. What search terms would find equivalent help articles/documentation on competitor sites?
+
+Examples of capabilities:
+- "Form Validation" - configuring validation rules for form fields
+- "Conditional Logic" - showing/hiding fields based on conditions
+- "PDF Generation" - converting forms to PDF documents
+- "Email Notifications" - sending automated emails on form submission
+- "Data Integration" - connecting forms to external systems
+- "Theme Customization" - changing the visual appearance
+- "Workflow Automation" - automating processes after submission
+
+Return ONLY valid JSON:
+{
+    "capability": {
+        "name": "Short capability name (2-4 words)",
+        "description": "One sentence description of what this capability does",
+        "category": "validation|logic|integration|customization|automation|submission|analytics|other",
+        "competitor_search_terms": ["term1", "term2", "term3", "term4", "term5"],
+        "common_url_paths": ["/help/validation", "/docs/form-validation", "/features/validation"]
+    }
+}"""
+
+_COMPETITOR_URLS_SYSTEM_PROMPT = """You are an expert at understanding competitor websites and their URL structures.
+
+TASK: Generate the most likely URLs where the competitor would document the given capability.
+
+Consider:
+1. Common URL patterns for help/documentation sites
+2. How the competitor likely names this feature
+3. Their URL structure based on the base URL
+
+Return ONLY valid JSON:
+{
+    "competitor_capability": {
+        "competitor_name": "the competitor's name",
+        "likely_feature_name": "What the competitor calls this feature",
+        "probable_urls": [
+            "<base_url>/path1",
+            "<base_url>/path2",
+            "<base_url>/path3"
+        ],
+        "search_query": "site:<base_url> <capability name>",
+        "terminology_hints": ["term1", "term2"]
+    }
+}
+Use the competitor's real base URL (no trailing slash) in probable_urls and search_query."""
+
+
+@lru_cache(maxsize=8)
+def _extraction_system_prompt(time_range: str, volume_field: str) -> str:
+    """Extraction system prompt; only varies with the three time ranges."""
+    return f"""You are an SEO expert. Analyze the article the user provides and extract REAL, GOOGLE-SEARCHABLE keywords.
+
+TASK: Extract exactly 5 keywords that:
+1. ARE ACTUALLY PRESENT in the article (title, headings, or content)
+2. Are REAL search terms people actually type into Google
+3. Are generic industry terms that can be used across products
+4. Are NOUNS or NOUN PHRASES only - DO NOT include verbs
+
+IMPORTANT RULES:
+- DO NOT include VERBS in keywords (no "create", "build", "manage", "use", etc.)
+- Focus on NOUNS and NOUN PHRASES only (e.g., "form builder", "data validation", "workflow automation")
+- DO NOT include product names: Adaptive Form, AEM, Adobe Experience Manager
+- Keywords should be concepts/things, not actions
+
+For each keyword, provide:
+- {time_range}ly search volume estimate
+- CPC (Cost Per Click) in USD - realistic estimate based on keyword competitiveness
+- Difficulty: "low", "medium", or "high" based on competition level
+
+Return ONLY valid JSON:
+{{
+    "keywords": [
+        {{
+            "keyword": "noun or noun phrase keyword",
+            "{volume_field}": <realistic_volume_integer>,
+            "cpc": <cpc_in_usd_decimal>,
+            "difficulty": "low|medium|high"
+        }}
+    ]
+}}"""
+
+
+@lru_cache(maxsize=8)
+def _equivalence_system_prompt(volume_field: str) -> str:
+    """Keyword-equivalence system prompt; only varies with the volume field."""
+    return f"""You are an SEO expert. The user gives you one article keyword and one competitor's content. Find the EQUIVALENT keyword/term that competitor uses for the same concept.
+
+For example:
+- If article keyword is "reCAPTCHA" → competitor might use "spam protection", "bot detection", "CAPTCHA verification"
+- If article keyword is "form validation" → competitor might use "field validation", "input validation", "validation rules"
+- If article keyword is "conditional logic" → competitor might use "branching logic", "skip logic", "form rules"
+
+RULES:
+1. The competitor keyword MUST be semantically related to the article keyword
+2. It should be a term the competitor ACTUALLY uses (found in their content/headings)
+3. Must be a NOUN or NOUN PHRASE - NO VERBS
+4. If you can't find an equivalent, use a closely related industry term
+
+Return ONLY valid JSON:
+{{
+    "article_keyword": "the article keyword exactly as given",
+    "competitor_keyword": {{
+        "keyword": "equivalent term the competitor uses",
+        "{volume_field}": <realistic_volume>,
+        "cpc": <cpc_in_usd>,
+        "difficulty": "low|medium|high",
+        "relevance_score": <1-10>,
+        "found_in": "heading|content|inferred"
+    }}
+}}"""
+
+
+@lru_cache(maxsize=8)
+def _rewrite_system_prompt(tone: str) -> str:
+    """
+    Section-rewrite system prompt; only varies with the tone.
+
+    All invariant instructions live here so Azure's automatic prefix
+    caching hits the full system message across chunks - the user message
+    carries only the keywords and the chunk text.
+    """
+    return f"""You are an SEO writer. Rewrite the text the user provides with their keywords integrated naturally.
+
+RULES:
+- Use <strong> tags around keywords
+- Keep ALL original information
+- Use HTML tags: <p>, <ul>, <li>
+- Maintain {tone} tone
+- DO NOT include any metadata like "Section X" in your output
+- Output ONLY the rewritten HTML content - no explanations, no section numbers, no metadata"""
+
+
+@lru_cache(maxsize=8)
+def _rewrite_system_message(tone: str) -> dict:
+    """
+    The full system message dict, shared across calls per tone - the
+    payload serializer only reads it, so one object serves every chunk
+    instead of allocating a fresh dict per LLM call.
+    """
+    return {"role": "system", "content": _rewrite_system_prompt(tone)}
+
+
+def _build_extraction_messages(
+    title: str,
+    headings: List[str],
+    content: str,
+    url: str,
+    time_range: str,
+    volume_field: str
+) -> List[dict]:
+    """
+    Build the extraction chat messages. Pure function so callers can run it
+    in a worker thread for long articles; the system message comes from the
+    cached per-time_range builder, keeping the prompt prefix byte-stable.
+    """
+    prompt = f"""ARTICLE URL: {url}
+ARTICLE TITLE: {title}
+
+ARTICLE HEADINGS:
+{orjson.dumps(headings[:20]).decode()}
+
+ARTICLE CONTENT:
+<<<ARTICLE_START>>>
+{budget_content(content)}
+<<<ARTICLE_END>>>"""
+
+    return [
+        {"role": "system", "content": _extraction_system_prompt(time_range, volume_field)},
+        {"role": "user", "content": prompt}
+    ]
+
 
 class AzureOpenAIClient:
     """Client for Azure OpenAI API - All analysis is dynamic, no fallbacks"""
@@ -41,57 +296,177 @@ class AzureOpenAIClient:
         self.api_version = AZURE_OPENAI_API_VERSION
         self.api_key = AZURE_OPENAI_API_KEY
         self.base_url = f"{self.endpoint}/openai/deployments/{self.deployment}/chat/completions?api-version={self.api_version}"
-    
-    async def chat_completion(self, messages: list, temperature: float = 0.7, max_tokens: int = 2000) -> str:
-        """Send a chat completion request to Azure OpenAI - raises exception on failure"""
+        # Response caches: same article / same competitor content means the
+        # low-temperature analysis calls are deterministic enough to reuse.
+        self._capability_cache = TTLCache(maxsize=128, ttl=3600)
+        self._competitor_keywords_cache = TTLCache(maxsize=64, ttl=3600)
+        # Keyword-equivalence answers ("what does Typeform call 'form
+        # validation'?") repeat across articles on the same topic; small
+        # entries, so a large cache with a long TTL pays for itself fast.
+        self._keyword_equivalence_cache = TTLCache(maxsize=10_000, ttl=86_400)
+        # Per-chunk rewrites keyed on (chunk, keywords, tone): re-running an
+        # article with tweaked keywords leaves most chunks identical
+        self._section_rewrite_cache = TTLCache(maxsize=128, ttl=3600)
+        # Shared HTTP client: every LLM step POSTs to the same Azure host,
+        # so keep-alive pooling skips a TLS handshake per call. Created
+        # lazily so it binds to the running event loop.
+        self._client = None
+        self._client_loop = None
+        # One gate for every LLM call in the process: the batched/gathered
+        # callers can burst well past Azure's RPM budget, and a 429 retry
+        # storm costs more than briefly queueing here.
+        self._sem = asyncio.Semaphore(int(os.environ.get("AZURE_OPENAI_MAX_CONCURRENCY", "8")))
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=120.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=30.0
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (call on server shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def chat_completion(
+        self,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        stream: bool = False,
+        response_format: Optional[dict] = None
+    ) -> str:
+        """
+        Send a chat completion request to Azure OpenAI - raises exception on failure.
+
+        With stream=True the response is consumed as server-sent-event deltas,
+        so token receipt overlaps generation instead of waiting for the full
+        body; the aggregated text is returned either way.
+
+        Concurrency is bounded by a shared semaphore, and 429/5xx responses
+        are retried with a jittered backoff that honors Retry-After - the
+        prompt is already built, so retrying here is far cheaper than
+        propagating the error and redoing the whole calling step.
+        """
         headers = {
             "Content-Type": "application/json",
             "api-key": self.api_key
         }
-        
+
         payload = {
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens
         }
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers=headers,
-                json=payload
-            )
-            
-            if response.status_code != 200:
-                error_text = response.text
-                print(f"OpenAI API Error: {response.status_code} - {error_text}")
-                raise Exception(f"OpenAI API Error: {response.status_code} - {error_text[:500]}")
-            
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+        if stream:
+            payload["stream"] = True
+        if response_format is not None:
+            payload["response_format"] = response_format
+
+        async with self._sem:
+            client = self._get_client()
+            for attempt in range(3):
+                if stream:
+                    async with client.stream(
+                        "POST",
+                        self.base_url,
+                        headers=headers,
+                        json=payload
+                    ) as response:
+                        if self._should_retry(response.status_code, attempt):
+                            await response.aread()
+                            await asyncio.sleep(self._retry_delay(response, attempt))
+                            continue
+
+                        if response.status_code != 200:
+                            # Slice the raw bytes before decoding - the error
+                            # detail is in the first part of the body and a
+                            # full decode of a large response buys nothing
+                            snippet = (await response.aread())[:500].decode('utf-8', errors='replace')
+                            logger.error("OpenAI API Error: %s - %s", response.status_code, snippet)
+                            raise Exception(f"OpenAI API Error: {response.status_code} - {snippet}")
+
+                        chunks = []
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data: "):
+                                continue
+                            data_str = line[6:]
+                            if data_str == "[DONE]":
+                                break
+                            event = orjson.loads(data_str)
+                            choices = event.get("choices")
+                            if choices:
+                                delta = choices[0].get("delta", {})
+                                content_piece = delta.get("content")
+                                if content_piece:
+                                    chunks.append(content_piece)
+                    return "".join(chunks)
+
+                response = await client.post(
+                    self.base_url,
+                    headers=headers,
+                    json=payload
+                )
+
+                if self._should_retry(response.status_code, attempt):
+                    await asyncio.sleep(self._retry_delay(response, attempt))
+                    continue
+
+                if response.status_code != 200:
+                    snippet = response.content[:500].decode('utf-8', errors='replace')
+                    logger.error("OpenAI API Error: %s - %s", response.status_code, snippet)
+                    raise Exception(f"OpenAI API Error: {response.status_code} - {snippet}")
+
+                data = orjson.loads(response.content)
+                return data["choices"][0]["message"]["content"]
+
+        raise Exception("OpenAI API Error: retries exhausted")
+
+    @staticmethod
+    def _should_retry(status_code: int, attempt: int) -> bool:
+        """Rate limits and server errors are transient; client errors aren't."""
+        return (status_code == 429 or status_code >= 500) and attempt < 2
+
+    @staticmethod
+    def _retry_delay(response, attempt: int) -> float:
+        """Honor Retry-After when Azure sends one, else jittered backoff."""
+        retry_after = response.headers.get("retry-after")
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = min(2 ** attempt, 30)
+        delay += random.uniform(0, 0.5)
+        logger.warning(
+            "OpenAI API %s - retrying in %.1fs (attempt %s/3)",
+            response.status_code, delay, attempt + 1
+        )
+        return delay
     
     def _get_volume_field_name(self, time_range: str) -> str:
         """Get the volume field name based on time range - raises exception for invalid input"""
-        volume_map = {
-            "week": "weekly_volume",
-            "year": "yearly_volume",
-            "month": "monthly_volume"
-        }
-        if time_range not in volume_map:
+        if time_range not in _VOLUME_FIELDS:
             raise Exception(f"Invalid time_range: {time_range}. Must be: week, month, or year")
-        return volume_map[time_range]
+        return _VOLUME_FIELDS[time_range]
     
     def _generate_semrush_url(self, keyword: str) -> str:
         """Generate SEMrush URL for keyword research"""
-        return SEMRUSH_URL_TEMPLATE.format(keyword=keyword.replace(' ', '+'))
+        return make_semrush_url(keyword)
     
     def _is_excluded_keyword(self, keyword: str) -> bool:
         """Check if keyword contains excluded product terms"""
-        keyword_lower = keyword.lower().strip()
-        for term in EXCLUDED_PRODUCT_TERMS:
-            if term in keyword_lower:
-                return True
-        return False
+        return _EXCLUDED_TERMS_RE.search(keyword.lower()) is not None
     
     async def identify_article_capability(
         self,
@@ -105,75 +480,48 @@ class AzureOpenAIClient:
         This is used to find equivalent pages on competitor websites.
         Returns: capability name, description, and search terms for finding competitor pages.
         """
-        prompt = f"""You are an expert at understanding technical documentation and product features.
+        cache_key = make_cache_key(
+            "identify_article_capability",
+            title.lower().strip(),
+            sorted(headings[:15]),
+            content[:3000],
+            url
+        )
+        cached = self._capability_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM]  Capability cache hit for: %s", url)
+            return cached
 
-ARTICLE URL: {url}
+        prompt = f"""ARTICLE URL: {url}
 ARTICLE TITLE: {title}
 
 ARTICLE HEADINGS:
-{json.dumps(headings[:15], indent=2)}
+{orjson.dumps(headings[:15]).decode()}
 
 ARTICLE CONTENT (first 3000 chars):
-{content[:3000]}
-
-TASK: Analyze this article and identify:
-1. What is the MAIN CAPABILITY or FEATURE this article is about?
-2. What would this capability be called on competitor websites?
-3. What search terms would find equivalent help articles/documentation on competitor sites?
-
-Examples of capabilities:
-- "Form Validation" - configuring validation rules for form fields
-- "Conditional Logic" - showing/hiding fields based on conditions
-- "PDF Generation" - converting forms to PDF documents
-- "Email Notifications" - sending automated emails on form submission
-- "Data Integration" - connecting forms to external systems
-- "Theme Customization" - changing the visual appearance
-- "Workflow Automation" - automating processes after submission
-
-Return ONLY valid JSON:
-{{
-    "capability": {{
-        "name": "Short capability name (2-4 words)",
-        "description": "One sentence description of what this capability does",
-        "category": "validation|logic|integration|customization|automation|submission|analytics|other",
-        "competitor_search_terms": ["term1", "term2", "term3", "term4", "term5"],
-        "common_url_paths": ["/help/validation", "/docs/form-validation", "/features/validation"]
-    }}
-}}"""
+{content[:3000]}"""
 
         messages = [
-            {
-                "role": "system",
-                "content": "You are a product analyst expert. Identify the core capability/feature from documentation. Return ONLY valid JSON."
-            },
+            {"role": "system", "content": _CAPABILITY_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
         
         response = await self.chat_completion(messages, temperature=0.2, max_tokens=1000)
         
-        # Parse JSON
-        json_start = response.find('{')
-        json_end = response.rfind('}') + 1
-        
-        if json_start == -1 or json_end <= json_start:
+        try:
+            data = _extract_json(response)
+        except ValueError:
             raise Exception("Failed to identify article capability - invalid JSON response")
+        capability = _require_fields(
+            data.get('capability'), ('name',), "Failed to identify article capability"
+        )
         
-        data = json.loads(response[json_start:json_end])
-        capability = data.get('capability')
-        
-        if not capability or not capability.get('name'):
-            raise Exception("Failed to identify article capability")
-        
-        print(f"\n{'='*70}")
-        print(f"[LLM]  CAPABILITY IDENTIFIED")
-        print(f"{'='*70}")
-        print(f"[LLM] Capability: {capability.get('name')}")
-        print(f"[LLM] Description: {capability.get('description')}")
-        print(f"[LLM] Category: {capability.get('category')}")
-        print(f"[LLM] Search Terms: {capability.get('competitor_search_terms')}")
-        print(f"[LLM] Common URL Paths: {capability.get('common_url_paths')}")
-        print(f"{'='*70}\n")
-        
+        logger.info("[LLM]  Capability identified: %s (%s)", capability.get('name'), capability.get('category'))
+        logger.debug("[LLM] Description: %s", capability.get('description'))
+        logger.debug("[LLM] Search Terms: %s", capability.get('competitor_search_terms'))
+        logger.debug("[LLM] Common URL Paths: %s", capability.get('common_url_paths'))
+
+        self._capability_cache.set(cache_key, capability)
         return capability
     
     async def find_competitor_capability_urls(
@@ -191,57 +539,26 @@ Return ONLY valid JSON:
         search_terms = capability.get('competitor_search_terms', [])
         common_paths = capability.get('common_url_paths', [])
         
-        prompt = f"""You are an expert at understanding competitor websites and their URL structures.
-
-CAPABILITY TO FIND: {capability_name}
+        prompt = f"""CAPABILITY TO FIND: {capability_name}
 DESCRIPTION: {capability.get('description', '')}
-SEARCH TERMS: {json.dumps(search_terms)}
+SEARCH TERMS: {orjson.dumps(search_terms).decode()}
 
 COMPETITOR: {competitor_name}
 COMPETITOR BASE URL: {competitor_base_url}
 
-{f"COMPETITOR CONTENT SAMPLE: {competitor_content[:2000]}" if competitor_content else ""}
-
-TASK: Generate the most likely URLs where {competitor_name} would document this capability.
-
-Consider:
-1. Common URL patterns for help/documentation sites
-2. How {competitor_name} likely names this feature
-3. Their URL structure based on the base URL
-
-Return ONLY valid JSON:
-{{
-    "competitor_capability": {{
-        "competitor_name": "{competitor_name}",
-        "likely_feature_name": "What {competitor_name} calls this feature",
-        "probable_urls": [
-            "{competitor_base_url.rstrip('/')}/path1",
-            "{competitor_base_url.rstrip('/')}/path2",
-            "{competitor_base_url.rstrip('/')}/path3"
-        ],
-        "search_query": "site:{competitor_base_url} {capability_name}",
-        "terminology_hints": ["term1", "term2"]
-    }}
-}}"""
+{f"COMPETITOR CONTENT SAMPLE: {competitor_content[:2000]}" if competitor_content else ""}"""
 
         messages = [
-            {
-                "role": "system",
-                "content": f"You are an expert at finding equivalent features on competitor websites. Generate realistic URLs for {competitor_name}. Return ONLY valid JSON."
-            },
+            {"role": "system", "content": _COMPETITOR_URLS_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
         
         response = await self.chat_completion(messages, temperature=0.3, max_tokens=800)
         
-        # Parse JSON
-        json_start = response.find('{')
-        json_end = response.rfind('}') + 1
-        
-        if json_start == -1 or json_end <= json_start:
+        try:
+            data = _extract_json(response)
+        except ValueError:
             raise Exception(f"Failed to find competitor URLs for {competitor_name}")
-        
-        data = json.loads(response[json_start:json_end])
         return data.get('competitor_capability', {})
     
     async def extract_article_keywords(
@@ -259,94 +576,73 @@ Return ONLY valid JSON:
         Raises exception on failure - no fallbacks.
         """
         volume_field = self._get_volume_field_name(time_range)
-        
-        prompt = f"""You are an SEO expert. Analyze this article and extract REAL, GOOGLE-SEARCHABLE keywords.
-
-ARTICLE URL: {url}
-ARTICLE TITLE: {title}
-
-ARTICLE HEADINGS:
-{json.dumps(headings[:20], indent=2)}
-
-ARTICLE CONTENT:
-{content[:4000]}
-
-TASK: Extract exactly 5 keywords that:
-1. ARE ACTUALLY PRESENT in the article (title, headings, or content)
-2. Are REAL search terms people actually type into Google
-3. Are generic industry terms that can be used across products
-4. Are NOUNS or NOUN PHRASES only - DO NOT include verbs
 
-IMPORTANT RULES:
-- DO NOT include VERBS in keywords (no "create", "build", "manage", "use", etc.)
-- Focus on NOUNS and NOUN PHRASES only (e.g., "form builder", "data validation", "workflow automation")
-- DO NOT include product names: Adaptive Form, AEM, Adobe Experience Manager
-- Keywords should be concepts/things, not actions
+        # Long articles make budget_content's sentence sampling plus the
+        # prompt assembly a noticeable CPU burst; push it to a worker thread
+        # so concurrent requests aren't blocked. Short content stays inline -
+        # the thread handoff would cost more.
+        if len(content) > 20_000:
+            messages = await asyncio.to_thread(
+                _build_extraction_messages, title, headings, content, url, time_range, volume_field
+            )
+        else:
+            messages = _build_extraction_messages(title, headings, content, url, time_range, volume_field)
 
-For each keyword, provide:
-- {time_range}ly search volume estimate
-- CPC (Cost Per Click) in USD - realistic estimate based on keyword competitiveness
-- Difficulty: "low", "medium", or "high" based on competition level
+        # Retry with feedback: a malformed LLM response only re-runs this
+        # call, not the scrape upstream. Feeding the validation error back
+        # lets the model fix its own output shape.
+        last_error = None
+        for attempt in range(3):
+            # json_object mode makes the model emit strictly parseable JSON;
+            # temperature 0 keeps repeat extractions deterministic and
+            # cache-friendly
+            response = await self.chat_completion(
+                messages,
+                temperature=0.0,
+                max_tokens=2500,
+                response_format={"type": "json_object"}
+            )
+            try:
+                return self._parse_article_keywords(response, volume_field)
+            except Exception as e:
+                last_error = e
+                if attempt < 2:
+                    messages.append({"role": "assistant", "content": response})
+                    messages.append({
+                        "role": "user",
+                        "content": f"Your output had this error: {e}. Fix it and return ONLY the corrected JSON."
+                    })
+                    await asyncio.sleep(1.0 * (attempt + 1))
 
-Return ONLY valid JSON:
-{{
-    "keywords": [
-        {{
-            "keyword": "noun or noun phrase keyword",
-            "{volume_field}": <realistic_volume_integer>,
-            "cpc": <cpc_in_usd_decimal>,
-            "difficulty": "low|medium|high"
-        }}
-    ]
-}}"""
+        raise Exception(f"Keyword extraction failed after retries: {last_error}")
 
-        messages = [
-            {
-                "role": "system", 
-                "content": "You are an SEO expert. Extract ONLY nouns and noun phrases as keywords. Include CPC and difficulty level. NO VERBS. DO NOT include product names. Return ONLY valid JSON."
-            },
-            {"role": "user", "content": prompt}
-        ]
-        
-        response = await self.chat_completion(messages, temperature=0.2, max_tokens=2500)
-        
-        # Parse JSON - raise exception if invalid
-        json_start = response.find('{')
-        json_end = response.rfind('}') + 1
-        
-        if json_start == -1 or json_end <= json_start:
-            raise Exception(f"OpenAI returned invalid JSON response")
-        
-        data = json.loads(response[json_start:json_end])
+    def _parse_article_keywords(self, response: str, volume_field: str) -> List[dict]:
+        """Parse and validate the extraction response - raises on bad shape."""
+        try:
+            data = _extract_json(response)
+        except ValueError:
+            raise Exception("OpenAI returned invalid JSON response")
         keywords = data.get('keywords')
-        
+
         if not keywords:
             raise Exception("OpenAI returned no keywords")
-        
+
         # Filter out product names and add metadata - NO FALLBACKS
         filtered_keywords = []
         for kw in keywords:
             keyword_text = kw.get('keyword', '')
-            kw_volume = kw.get(volume_field)
-            kw_cpc = kw.get('cpc')
-            kw_difficulty = kw.get('difficulty')
-            
-            # Validate required fields - raise exception if missing
             if not keyword_text:
                 continue
-            if kw_volume is None:
-                raise Exception(f"OpenAI did not return search volume for keyword: {keyword_text}")
-            if kw_cpc is None:
-                raise Exception(f"OpenAI did not return CPC for keyword: {keyword_text}")
-            if kw_difficulty is None:
-                raise Exception(f"OpenAI did not return difficulty for keyword: {keyword_text}")
-            
+
+            # Validate required fields - raise exception if missing
+            _require_fields(kw, (volume_field, 'cpc', 'difficulty'), f"keyword '{keyword_text}'")
+
             if not self._is_excluded_keyword(keyword_text):
                 filtered_keywords.append({
                     "keyword": keyword_text,
-                    "search_volume": kw_volume,
-                    "cpc": kw_cpc,
-                    "difficulty": kw_difficulty,
+                    "search_volume": kw.get(volume_field),
+                    "cpc": kw.get('cpc'),
+                    "difficulty": kw.get('difficulty'),
                     "tool": "Azure OpenAI + Web Scraping",
                     "source": "Article Content Analysis",
                     "semrush_url": self._generate_semrush_url(keyword_text)
@@ -363,66 +659,261 @@ Return ONLY valid JSON:
         article_context: str,
         competitor_name: str,
         competitor_content: str,
-        competitor_headings: List[str],
+        competitor_headings: str,
         time_range: str
     ) -> dict:
         """
         For ONE article keyword, find the equivalent keyword/term used by ONE competitor.
         This ensures proper 1:1 mapping between article keywords and competitor keywords.
+
+        competitor_headings is the pre-joined heading string and
+        competitor_content should already be truncated by the caller, so the
+        per-competitor prep isn't redone for every keyword in the fan-out.
         """
         volume_field = self._get_volume_field_name(time_range)
-        
-        prompt = f"""You are an SEO expert. Find what term/keyword "{competitor_name}" uses for the same concept as "{article_keyword}".
 
-ARTICLE KEYWORD: "{article_keyword}"
+        # Exact-match cache on (keyword, competitor, time_range): the same
+        # equivalence question recurs across articles on similar topics, and
+        # a hit skips the whole round trip. time_range is part of the key
+        # because it changes the volume field in the response.
+        cache_key = make_cache_key(
+            "keyword_equivalence",
+            article_keyword.lower().strip(),
+            competitor_name,
+            time_range
+        )
+        cached = self._keyword_equivalence_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM]  Equivalence cache hit: '%s' x %s", article_keyword, competitor_name)
+            return cached
+        
+        # System message is identical for every (keyword, competitor) pair -
+        # only per-pair data varies - so the fan-out in the iterative mapper
+        # hits Azure's prompt cache on the shared prefix
+        prompt = f"""ARTICLE KEYWORD: "{article_keyword}"
 ARTICLE CONTEXT: {article_context[:500]}
 
 COMPETITOR: {competitor_name}
-COMPETITOR HEADINGS: {', '.join(competitor_headings[:15])}
-COMPETITOR CONTENT: {competitor_content[:3000]}
+COMPETITOR HEADINGS: {competitor_headings}
+COMPETITOR CONTENT: {competitor_content[:3000]}"""
+
+        messages = [
+            {"role": "system", "content": _equivalence_system_prompt(volume_field)},
+            {"role": "user", "content": prompt}
+        ]
+        
+        # json_object mode guarantees the response is bare parseable JSON,
+        # so the substring-extraction fallback isn't needed here; temperature
+        # 0 makes repeat pairs deterministic for the equivalence cache
+        response = await self.chat_completion(
+            messages,
+            temperature=0.0,
+            max_tokens=500,
+            response_format={"type": "json_object"}
+        )
 
-TASK: Find the EQUIVALENT keyword/term that {competitor_name} uses for "{article_keyword}".
+        try:
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            return None
+        if data and data.get('competitor_keyword'):
+            self._keyword_equivalence_cache.set(cache_key, data)
+        return data
 
-For example:
-- If article keyword is "reCAPTCHA" → competitor might use "spam protection", "bot detection", "CAPTCHA verification"
-- If article keyword is "form validation" → competitor might use "field validation", "input validation", "validation rules"
-- If article keyword is "conditional logic" → competitor might use "branching logic", "skip logic", "form rules"
+    def _normalize_competitor_term(self, ckw: dict, comp_name: str, volume_field: str) -> dict:
+        """Normalize one competitor keyword entry with safe defaults."""
+        return {
+            "keyword": ckw.get('keyword', ''),
+            "competitor": comp_name,
+            "search_volume": ckw.get(volume_field) or ckw.get('monthly_volume') or 500,
+            "cpc": ckw.get('cpc') or 1.5,
+            "difficulty": ckw.get('difficulty') or 'medium',
+            "relevance_score": ckw.get('relevance_score') or 7,
+            "found_in": ckw.get('found_in', 'content')
+        }
+
+    async def _map_keywords_batched(
+        self,
+        article_kw_list: List[str],
+        competitor_content: List[dict],
+        time_range: str,
+        article_title: str,
+        article_content: str,
+        product: str
+    ) -> List[dict]:
+        """
+        Map ALL article keywords to ALL competitors in ONE LLM call.
+
+        The per-keyword-per-competitor approach costs N*M round-trips; a single
+        structured prompt amortizes the shared article context across all
+        competitors. The stable article context is placed first so providers
+        with prompt-prefix caching can reuse it across runs.
+        """
+        volume_field = self._get_volume_field_name(time_range)
+
+        competitor_sections = []
+        for comp in competitor_content:
+            comp_name = comp.get('competitor_name', '')
+            competitor_sections.append(
+                f"### COMPETITOR: {comp_name}\n"
+                f"HEADINGS: {', '.join(comp.get('headings', [])[:15])}\n"
+                f"CONTENT: {comp.get('content', '')[:3000]}"
+            )
+
+        prompt = f"""You are an SEO expert. For EACH article keyword below, find the equivalent term EACH competitor uses for the same concept.
+
+PRODUCT: {product}
+ARTICLE TITLE: {article_title}
+ARTICLE CONTEXT: {article_content[:300]}
+ARTICLE KEYWORDS: {orjson.dumps(article_kw_list).decode()}
+
+{chr(10).join(competitor_sections)}
 
 RULES:
-1. The competitor keyword MUST be semantically related to "{article_keyword}"
-2. It should be a term the competitor ACTUALLY uses (found in their content/headings)
-3. Must be a NOUN or NOUN PHRASE - NO VERBS
-4. If you can't find an equivalent, use a closely related industry term
+1. Each competitor keyword MUST be semantically related to its article keyword
+2. Prefer terms the competitor ACTUALLY uses (found in their content/headings)
+3. Must be NOUNS or NOUN PHRASES - NO VERBS
+4. If no equivalent exists, use a closely related industry term
 
 Return ONLY valid JSON:
 {{
-    "article_keyword": "{article_keyword}",
-    "competitor_keyword": {{
-        "keyword": "equivalent term {competitor_name} uses",
-        "{volume_field}": <realistic_volume>,
-        "cpc": <cpc_in_usd>,
-        "difficulty": "low|medium|high",
-        "relevance_score": <1-10>,
-        "found_in": "heading|content|inferred"
-    }}
+    "mappings": [
+        {{
+            "article_keyword": "one of the article keywords",
+            "competitor_keywords": [
+                {{
+                    "keyword": "equivalent term the competitor uses",
+                    "competitor": "competitor name",
+                    "{volume_field}": <realistic_volume>,
+                    "cpc": <cpc_in_usd>,
+                    "difficulty": "low|medium|high",
+                    "relevance_score": <1-10>,
+                    "found_in": "heading|content|inferred"
+                }}
+            ]
+        }}
+    ]
 }}"""
 
         messages = [
-            {"role": "system", "content": f"Find what {competitor_name} calls the same feature/concept as '{article_keyword}'. Return ONLY valid JSON."},
+            {"role": "system", "content": "You are an SEO expert mapping article keywords to the equivalent terms competitors use. Return ONLY valid JSON."},
             {"role": "user", "content": prompt}
         ]
-        
-        response = await self.chat_completion(messages, temperature=0.3, max_tokens=500)
-        
-        json_start = response.find('{')
-        json_end = response.rfind('}') + 1
-        
-        if json_start == -1 or json_end <= json_start:
+
+        # Scale the completion budget with the mapping grid so a full
+        # N keywords x M competitors response is never truncated mid-JSON
+        max_tokens = min(500 * len(article_kw_list) * len(competitor_content), 6000)
+        # Stream the largest analysis response so receive overlaps decode
+        response = await self.chat_completion(messages, temperature=0.3, max_tokens=max_tokens, stream=True)
+
+        try:
+            data = _extract_json(response)
+        except ValueError:
+            raise Exception("Batched keyword mapping returned invalid JSON")
+        mappings = data.get('mappings')
+        if not mappings:
+            raise Exception("Batched keyword mapping returned no mappings")
+
+        article_kw_set = {kw.lower() for kw in article_kw_list}
+        results = []
+        for mapping in mappings:
+            article_kw = mapping.get('article_keyword', '')
+            if article_kw.lower() not in article_kw_set:
+                continue
+            terms = []
+            for ckw in mapping.get('competitor_keywords', []):
+                ckw_text = ckw.get('keyword', '')
+                if ckw_text and not self._is_excluded_keyword(ckw_text):
+                    terms.append(self._normalize_competitor_term(
+                        ckw, ckw.get('competitor', ''), volume_field
+                    ))
+            results.append({"article_keyword": article_kw, "competitor_terms": terms})
+
+        return results
+
+    async def _map_keywords_iterative(
+        self,
+        article_kw_list: List[str],
+        competitor_content: List[dict],
+        time_range: str,
+        article_title: str,
+        article_content: str
+    ) -> List[dict]:
+        """
+        Fallback: map each article keyword to each competitor with individual
+        LLM calls. All (keyword, competitor) pairs fan out concurrently -
+        each call is 1-3s of network wait, so running them sequentially
+        multiplies latency by N*M for no reason. A semaphore bounds the
+        fan-out so a large keyword set doesn't trip Azure rate limits.
+        """
+        volume_field = self._get_volume_field_name(time_range)
+        article_context = f"{article_title}. {article_content[:300]}"
+        semaphore = asyncio.Semaphore(8)
+
+        # Truncate content and join headings once per competitor, not once
+        # per (keyword, competitor) pair
+        prepped_comps = [
+            {
+                "name": comp.get('competitor_name', ''),
+                "content": comp.get('content', '')[:3000],
+                "headings": ', '.join(comp.get('headings', [])[:15])
+            }
+            for comp in competitor_content
+        ]
+
+        async def map_pair(article_kw: str, comp: dict) -> Optional[dict]:
+            comp_name = comp['name']
+            comp_text = comp['content']
+
+            if not comp_text:
+                return None
+
+            try:
+                async with semaphore:
+                    result = await self.find_competitor_keyword_for_article_keyword(
+                        article_keyword=article_kw,
+                        article_context=article_context,
+                        competitor_name=comp_name,
+                        competitor_content=comp_text,
+                        competitor_headings=comp['headings'],
+                        time_range=time_range
+                    )
+
+                if result and result.get('competitor_keyword'):
+                    ckw = result['competitor_keyword']
+                    ckw_text = ckw.get('keyword', '')
+
+                    if ckw_text and not self._is_excluded_keyword(ckw_text):
+                        term = self._normalize_competitor_term(ckw, comp_name, volume_field)
+                        logger.info("[LLM]    %s: '%s' (vol: %s) for '%s'", comp_name, ckw_text, term['search_volume'], article_kw)
+                        return term
+
+            except Exception as e:
+                logger.warning("[LLM]    %s: Error - %s", comp_name, str(e)[:50])
             return None
-        
-        data = json.loads(response[json_start:json_end])
-        return data
-    
+
+        logger.info("[LLM] Mapping %s keywords x %s competitors concurrently...", len(article_kw_list), len(competitor_content))
+        pairs = [
+            (kw_idx, comp)
+            for kw_idx in range(len(article_kw_list))
+            for comp in prepped_comps
+        ]
+        mapped = await asyncio.gather(
+            *(map_pair(article_kw_list[kw_idx], comp) for kw_idx, comp in pairs)
+        )
+
+        # Reshape the flat gather output back into per-keyword term lists,
+        # preserving the original keyword and competitor order
+        terms_by_keyword = [[] for _ in article_kw_list]
+        for (kw_idx, _comp), term in zip(pairs, mapped):
+            if term is not None:
+                terms_by_keyword[kw_idx].append(term)
+
+        return [
+            {"article_keyword": article_kw, "competitor_terms": terms}
+            for article_kw, terms in zip(article_kw_list, terms_by_keyword)
+        ]
+
     async def get_competitor_keywords(
         self, 
         article_keywords: List[dict], 
@@ -454,131 +945,117 @@ Return ONLY valid JSON:
         
         if not competitor_content or len(competitor_content) == 0:
             raise Exception("No competitor content provided - competitor websites must be scraped first")
-        
+
+        cache_key = make_cache_key(
+            "get_competitor_keywords",
+            sorted(article_kw_list),
+            product,
+            time_range,
+            [(c.get('competitor_name'), c.get('content', '')) for c in competitor_content]
+        )
+        cached = self._competitor_keywords_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM]  Competitor keywords cache hit for product: %s", product)
+            return cached
+
         # Limit to 5 article keywords and 2 competitors for faster processing
         article_kw_list = article_kw_list[:5]
         competitor_content = competitor_content[:2]
         
-        print(f"\n{'='*70}")
-        print(f"[LLM]  MAPPING ARTICLE KEYWORDS TO COMPETITOR KEYWORDS")
-        print(f"{'='*70}")
-        print(f"[LLM] Article keywords to map: {len(article_kw_list)} (limited to 5)")
-        print(f"[LLM] Competitors with content: {len(competitor_content)} (limited to 2)")
-        for comp in competitor_content:
-            print(f"[LLM]   - {comp.get('competitor_name')}: {len(comp.get('content', ''))} chars")
-        print(f"{'='*70}")
-        
-        # For each article keyword, find ALL equivalent competitor keywords
+        logger.info(
+            "[LLM]  Mapping %s article keywords (limited to 5) to %s competitors (limited to 2)",
+            len(article_kw_list), len(competitor_content)
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for comp in competitor_content:
+                logger.debug("[LLM]   - %s: %s chars", comp.get('competitor_name'), len(comp.get('content', '')))
+        
+        # Map article keywords to competitor terms: single batched call first
+        # (one round-trip for all keywords x competitors), per-keyword calls
+        # only as fallback when the batched response can't be used.
+        try:
+            raw_mappings = await self._map_keywords_batched(
+                article_kw_list=article_kw_list,
+                competitor_content=competitor_content,
+                time_range=time_range,
+                article_title=article_title,
+                article_content=article_content,
+                product=product
+            )
+            logger.info("[LLM]  Batched mapping: %s article keywords mapped in one call", len(raw_mappings))
+        except Exception as batch_error:
+            logger.warning("[LLM]  Batched mapping failed (%s), falling back to per-keyword calls", str(batch_error)[:80])
+            raw_mappings = await self._map_keywords_iterative(
+                article_kw_list=article_kw_list,
+                competitor_content=competitor_content,
+                time_range=time_range,
+                article_title=article_title,
+                article_content=article_content
+            )
+
         keyword_mappings = []
         competitor_keywords_all = []
-        
-        for idx, article_kw in enumerate(article_kw_list, 1):
-            print(f"\n[LLM] [{idx}/{len(article_kw_list)}] Finding competitor keywords for: '{article_kw}'")
-            
+        # Index by normalized keyword so dedupe below is a hash lookup, not
+        # a linear scan of everything collected so far
+        kw_index = {}
+        article_kw_index = {
+            akw['keyword'].lower(): akw for akw in article_keywords if akw.get('keyword')
+        }
+
+        for mapping in raw_mappings:
+            article_kw = mapping["article_keyword"]
+            competitor_terms_for_keyword = mapping["competitor_terms"]
+
+            if not competitor_terms_for_keyword:
+                continue
+
             # Get original article keyword data
-            article_kw_data = None
-            for akw in article_keywords:
-                if akw.get('keyword', '').lower() == article_kw.lower():
-                    article_kw_data = akw
-                    break
-            
-            # For each competitor, find what they call this feature
-            competitor_terms_for_keyword = []
-            
-            for comp in competitor_content:
-                comp_name = comp.get('competitor_name', '')
-                comp_text = comp.get('content', '')
-                comp_headings = comp.get('headings', [])
-                
-                if not comp_text:
-                    continue
-                
-                try:
-                    result = await self.find_competitor_keyword_for_article_keyword(
-                        article_keyword=article_kw,
-                        article_context=f"{article_title}. {article_content[:300]}",
-                        competitor_name=comp_name,
-                        competitor_content=comp_text,
-                        competitor_headings=comp_headings,
-                        time_range=time_range
-                    )
-                    
-                    if result and result.get('competitor_keyword'):
-                        ckw = result['competitor_keyword']
-                        ckw_text = ckw.get('keyword', '')
-                        
-                        if ckw_text and not self._is_excluded_keyword(ckw_text):
-                            # Get values with defaults to avoid errors
-                            kw_volume = ckw.get(volume_field) or ckw.get('monthly_volume') or 500
-                            kw_cpc = ckw.get('cpc') or 1.5
-                            kw_difficulty = ckw.get('difficulty') or 'medium'
-                            kw_relevance = ckw.get('relevance_score') or 7
-                            
-                            competitor_terms_for_keyword.append({
-                                "keyword": ckw_text,
-                                "competitor": comp_name,
-                                "search_volume": kw_volume,
-                                "cpc": kw_cpc,
-                                "difficulty": kw_difficulty,
-                                "relevance_score": kw_relevance,
-                                "found_in": ckw.get('found_in', 'content')
-                            })
-                            print(f"[LLM]    {comp_name}: '{ckw_text}' (vol: {kw_volume})")
-                
-                except Exception as e:
-                    print(f"[LLM]    {comp_name}: Error - {str(e)[:50]}")
-                    continue
-            
-            # Add ALL competitor keywords for this article keyword (not just best match)
-            if competitor_terms_for_keyword:
-                # Sort by volume
-                competitor_terms_for_keyword.sort(key=lambda x: x.get('search_volume', 0), reverse=True)
-                
-                # Add ALL competitor keywords to the global list
-                for term in competitor_terms_for_keyword:
-                    # Check if this keyword already exists
-                    existing_kw = None
-                    for existing in competitor_keywords_all:
-                        if existing['keyword'].lower().strip() == term['keyword'].lower().strip():
-                            existing_kw = existing
-                            break
-                    
-                    if existing_kw:
-                        # Add competitor if not already there
-                        if term['competitor'] not in existing_kw['used_by']:
-                            existing_kw['used_by'].append(term['competitor'])
-                    else:
-                        competitor_keywords_all.append({
-                            "keyword": term['keyword'],
-                            "search_volume": term['search_volume'],
-                            "cpc": term['cpc'],
-                            "difficulty": term['difficulty'],
-                            "tool": "Competitor Website Scraping",
-                            "source": "Competitor Analysis",
-                            "used_by": [term['competitor']],
-                            "semrush_url": self._generate_semrush_url(term['keyword'])
-                        })
-                
-                # Create mapping with ALL competitor keywords for this article keyword
-                keyword_mappings.append({
-                    "article_keyword": {
-                        "keyword": article_kw,
-                        "search_volume": article_kw_data.get('search_volume') if article_kw_data else 0
-                    },
-                    "competitor_keywords": competitor_terms_for_keyword  # ALL keywords
-                })
-                
-                print(f"[LLM]   → Found {len(competitor_terms_for_keyword)} competitor keywords for '{article_kw}'")
-                
+            article_kw_data = article_kw_index.get(article_kw.lower())
+
+            # Sort by volume
+            competitor_terms_for_keyword.sort(key=lambda x: x.get('search_volume', 0), reverse=True)
+
+            # Add ALL competitor keywords to the global list
+            for term in competitor_terms_for_keyword:
+                # Check if this keyword already exists
+                existing_kw = kw_index.get(term['keyword'].lower().strip())
+
+                if existing_kw:
+                    # Add competitor if not already there
+                    if term['competitor'] not in existing_kw['used_by']:
+                        existing_kw['used_by'].append(term['competitor'])
+                else:
+                    entry = {
+                        "keyword": term['keyword'],
+                        "search_volume": term['search_volume'],
+                        "cpc": term['cpc'],
+                        "difficulty": term['difficulty'],
+                        "tool": "Competitor Website Scraping",
+                        "source": "Competitor Analysis",
+                        "used_by": [term['competitor']],
+                        "semrush_url": self._generate_semrush_url(term['keyword'])
+                    }
+                    competitor_keywords_all.append(entry)
+                    kw_index[term['keyword'].lower().strip()] = entry
+
+            # Create mapping with ALL competitor keywords for this article keyword
+            keyword_mappings.append({
+                "article_keyword": {
+                    "keyword": article_kw,
+                    "search_volume": article_kw_data.get('search_volume') if article_kw_data else 0
+                },
+                "competitor_keywords": competitor_terms_for_keyword  # ALL keywords
+            })
+
+            logger.info("[LLM]   → Found %s competitor keywords for '%s'", len(competitor_terms_for_keyword), article_kw)
+
+
         # Print mapping summary
-        print(f"\n{'='*70}")
-        print(f"[LLM]  KEYWORD MAPPING SUMMARY")
-        print(f"{'='*70}")
-        for mapping in keyword_mappings:
-            art_kw = mapping['article_keyword']['keyword']
-            comp_kws = [ck['keyword'] for ck in mapping.get('competitor_keywords', [])]
-            print(f"[LLM] '{art_kw}' → {comp_kws}")
-        print(f"{'='*70}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for mapping in keyword_mappings:
+                art_kw = mapping['article_keyword']['keyword']
+                comp_kws = [ck['keyword'] for ck in mapping.get('competitor_keywords', [])]
+                logger.debug("[LLM] '%s' → %s", art_kw, comp_kws)
         
         # Prepare article keywords with full data - limit to 5
         article_keywords_clean = []
@@ -640,81 +1117,108 @@ Return ONLY valid JSON:
             if len(suggested_keywords) >= 5:
                 break
         
-        print(f"\n{'='*70}")
-        print(f"[LLM]  FINAL KEYWORD SUMMARY")
-        print(f"{'='*70}")
-        print(f"[LLM] Article Keywords: {len(article_keywords_clean)}")
-        print(f"[LLM] Competitor Keywords: {len(competitor_keywords_all)}")
-        print(f"[LLM] Suggested Keywords (Top 10): {len(suggested_keywords)}")
-        for idx, sk in enumerate(suggested_keywords, 1):
-            print(f"[LLM]   {idx}. '{sk['keyword']}' - Volume: {sk['search_volume']}")
-        print(f"{'='*70}\n")
+        logger.info(
+            "[LLM]  Final summary: %s article, %s competitor, %s suggested keywords",
+            len(article_keywords_clean), len(competitor_keywords_all), len(suggested_keywords)
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, sk in enumerate(suggested_keywords, 1):
+                logger.debug("[LLM]   %s. '%s' - Volume: %s", idx, sk['keyword'], sk['search_volume'])
         
-        return {
+        result = {
             "article_keywords": article_keywords_clean,
             "competitor_keywords": competitor_keywords_all,
             "suggested_keywords": suggested_keywords,
             "keyword_mappings": keyword_mappings
         }
+        self._competitor_keywords_cache.set(cache_key, result)
+        return result
     
     def _split_into_sections(self, content: str, max_chunk_size: int = 4000) -> List[str]:
         """
         Split content into chunks for processing.
-        Uses sentence boundaries when possible.
+
+        Packs whole paragraphs first, then falls back to sentence and word
+        boundaries for oversized ones, so chunks never cut mid-sentence -
+        severed context makes the LLM patch the join and trips the
+        too-little-output retry more often.
         """
-        import re
-        
         content = content.strip()
-        
+
         # If content is small enough, return as single chunk
         if len(content) <= max_chunk_size:
             return [content]
-        
+
         chunks = []
-        
-        # Split by sentences (period, exclamation, question followed by space or newline)
-        sentences = re.split(r'(?<=[.!?])\s+', content)
-        
-        current_chunk = ""
-        for sentence in sentences:
+
+        # Greedily pack paragraphs into chunks; oversized paragraphs are
+        # packed at sentence granularity by the helper
+        current = []
+        current_len = 0
+        for paragraph in _PARAGRAPH_SPLIT_RE.split(content):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if current and current_len + len(paragraph) + 2 > max_chunk_size:
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_len = 0
+            if len(paragraph) > max_chunk_size:
+                chunks.extend(self._pack_sentences(paragraph, max_chunk_size))
+            else:
+                current.append(paragraph)
+                current_len += len(paragraph) + 2 if current_len else len(paragraph)
+
+        if current:
+            chunks.append('\n\n'.join(current))
+
+        logger.info("[Chunking] Split %s chars into %s chunks", len(content), len(chunks))
+        return chunks
+
+    @staticmethod
+    def _pack_sentences(text: str, max_chunk_size: int) -> List[str]:
+        """Pack one oversized paragraph into chunks at sentence boundaries."""
+        chunks = []
+
+        # Accumulate sentences in a list with a running length and join once
+        # per finalized chunk - repeated `current_chunk += sentence` copies
+        # the growing chunk on every append, quadratic over long articles
+        current = []
+        current_len = 0
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
             # If adding this sentence would exceed limit
-            if len(current_chunk) + len(sentence) + 1 > max_chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
+            if current_len + len(sentence) + 1 > max_chunk_size:
+                if current:
+                    chunks.append(' '.join(current).strip())
                 # If single sentence is too long, force split it
                 if len(sentence) > max_chunk_size:
                     # Split at word boundaries
                     words = sentence.split(' ')
-                    sub_chunk = ""
+                    sub = []
+                    sub_len = 0
                     for word in words:
-                        if len(sub_chunk) + len(word) + 1 > max_chunk_size:
-                            if sub_chunk:
-                                chunks.append(sub_chunk.strip())
-                            sub_chunk = word
+                        if sub_len + len(word) + 1 > max_chunk_size:
+                            if sub:
+                                chunks.append(' '.join(sub).strip())
+                            sub = [word]
+                            sub_len = len(word)
                         else:
-                            sub_chunk += " " + word if sub_chunk else word
-                    current_chunk = sub_chunk
+                            sub.append(word)
+                            sub_len += len(word) + 1 if sub_len else len(word)
+                    current = sub
+                    current_len = sub_len
                 else:
-                    current_chunk = sentence
+                    current = [sentence]
+                    current_len = len(sentence)
             else:
-                current_chunk += " " + sentence if current_chunk else sentence
-        
+                current.append(sentence)
+                current_len += len(sentence) + 1 if current_len else len(sentence)
+
         # Add remaining content
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-        
-        # If no chunks created, force split by character
-        if not chunks:
-            for i in range(0, len(content), max_chunk_size):
-                chunk = content[i:i + max_chunk_size]
-                # Try to break at last space
-                if i + max_chunk_size < len(content):
-                    last_space = chunk.rfind(' ')
-                    if last_space > max_chunk_size * 0.5:
-                        chunk = chunk[:last_space]
-                chunks.append(chunk.strip())
-        
-        print(f"[Chunking] Split {len(content)} chars into {len(chunks)} chunks")
+        remaining = ' '.join(current).strip()
+        if remaining:
+            chunks.append(remaining)
+
         return chunks
     
     async def _rewrite_section(
@@ -726,46 +1230,50 @@ Return ONLY valid JSON:
         tone: str
     ) -> str:
         """Rewrite a single section with SEO keywords."""
-        
-        keywords_str = ", ".join([f'"{kw}"' for kw in keywords])
-        
-        prompt = f"""Rewrite this text for SEO. Integrate these keywords naturally: {keywords_str}
 
-RULES:
-- Use <strong> tags around keywords
-- Keep ALL original information
-- Use HTML tags: <p>, <ul>, <li>
-- Maintain {tone} tone
-- DO NOT include any metadata like "Section X" in your output
-- Output ONLY the rewritten HTML content
+        # Identical chunk+keywords+tone tuples recur when users re-run an
+        # article or paragraphs repeat across docs - skip the LLM round-trip.
+        # Keywords are sorted so order doesn't split the cache.
+        cache_key = make_cache_key(
+            "rewrite_section", section, sorted(k.lower() for k in keywords), tone
+        )
+        cached = self._section_rewrite_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[ContentRewriting] Cache hit for chunk %s", section_num)
+            return cached
 
-TEXT TO REWRITE:
-{section}"""
+        # Sorted so the same keyword set always renders the same prompt
+        keywords_str = ", ".join(f'"{kw}"' for kw in sorted(keywords))
 
         messages = [
-            {"role": "system", "content": "You are an SEO writer. Rewrite the given text with keywords integrated. Output ONLY HTML content - no explanations, no section numbers, no metadata."},
-            {"role": "user", "content": prompt}
+            _rewrite_system_message(tone),
+            {"role": "user", "content": f"Keywords: {keywords_str}\n\nTEXT TO REWRITE:\n{section}"}
         ]
         
-        response = await self.chat_completion(messages, temperature=0.5, max_tokens=4096)
+        # Stream the completion: tokens accumulate as they arrive instead of
+        # waiting on the full response body, which shortens each chunk's
+        # occupancy of the semaphore slot in the gathered rewrite
+        response = await self.chat_completion(messages, temperature=0.5, max_tokens=4096, stream=True)
         
         # Clean up response
         result = response.strip()
         
-        # Remove markdown code blocks if present
+        # Remove markdown code blocks if present - trim the fence lines by
+        # slicing instead of splitting a multi-KB response into a line list
         if result.startswith('```'):
-            lines = result.split('\n')
-            if lines[0].startswith('```'):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]
-            result = '\n'.join(lines)
+            nl = result.find('\n')
+            if nl != -1:
+                result = result[nl + 1:]
+        if result.rstrip().endswith('```'):
+            result = result[:result.rfind('```')].rstrip()
         
         # Remove any "Section X of Y" text that might have been included
-        import re
-        result = re.sub(r'(?i)section\s+\d+\s+(of|/)\s+\d+:?\s*', '', result)
-        result = re.sub(r'(?i)chunk\s+\d+\s+(of|/)\s+\d+:?\s*', '', result)
-        
+        result = _SECTION_MARKER_RE.sub('', result)
+        result = _CHUNK_MARKER_RE.sub('', result)
+
+        if result and len(result) > 50:
+            self._section_rewrite_cache.set(cache_key, result)
+
         return result
     
     async def rewrite_content_for_seo(
@@ -785,75 +1293,35 @@ TEXT TO REWRITE:
         keywords_to_use = target_keywords[:3]
         original_length = len(content)
         
-        print(f"\n{'='*70}")
-        print(f"[ContentRewriting]  FULL ARTICLE SEO REWRITING (CHUNKED)")
-        print(f"{'='*70}")
-        print(f"[ContentRewriting] Original content: {original_length} characters")
-        print(f"[ContentRewriting] Target keywords: {keywords_to_use}")
+        logger.info(
+            "[ContentRewriting]  Full article SEO rewriting: %s chars, keywords %s",
+            original_length, keywords_to_use
+        )
         
         # Split content into chunks (4000 chars each)
         chunks = self._split_into_sections(content, max_chunk_size=4000)
         total_chunks = len(chunks)
         
-        print(f"[ContentRewriting] Split into {total_chunks} chunks:")
-        for i, chunk in enumerate(chunks):
-            print(f"[ContentRewriting]   Chunk {i+1}: {len(chunk)} chars")
+        logger.info("[ContentRewriting] Split into %s chunks", total_chunks)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, chunk in enumerate(chunks):
+                logger.debug("[ContentRewriting]   Chunk %s: %s chars", i + 1, len(chunk))
         
-        # Rewrite each chunk with retry logic
-        rewritten_chunks = []
+        # Rewrite chunks concurrently; order is restored from the chunk
+        # index after the fan-out.
+        rewritten_chunks: List[Optional[str]] = [None] * total_chunks
         successful = 0
-        
-        for i, chunk in enumerate(chunks):
-            chunk_num = i + 1
-            print(f"\n[ContentRewriting]  Processing chunk {chunk_num}/{total_chunks}...")
-            
-            # Try up to 2 times per chunk
-            max_retries = 2
-            rewritten = None
-            
-            for attempt in range(max_retries):
-                try:
-                    rewritten = await self._rewrite_section(
-                        section=chunk,
-                        keywords=keywords_to_use,
-                        section_num=chunk_num,
-                        total_sections=total_chunks,
-                        tone=tone
-                    )
-                    
-                    if rewritten and len(rewritten) > 50:
-                        rewritten_chunks.append(rewritten)
-                        successful += 1
-                        print(f"[ContentRewriting]  Chunk {chunk_num}: {len(chunk)} → {len(rewritten)} chars")
-                        break
-                    else:
-                        print(f"[ContentRewriting] ️ Chunk {chunk_num} attempt {attempt+1}: LLM returned too little")
-                        if attempt == max_retries - 1:
-                            # Last attempt failed, use original
-                            rewritten_chunks.append(f"<p>{chunk}</p>")
-                    
-                except Exception as e:
-                    error_msg = str(e)[:150]
-                    print(f"[ContentRewriting]  Chunk {chunk_num} attempt {attempt+1} error: {error_msg}")
-                    
-                    if attempt == max_retries - 1:
-                        # Last attempt failed, use original with basic HTML
-                        print(f"[ContentRewriting] ️ Using original content for chunk {chunk_num}")
-                        rewritten_chunks.append(f"<p>{chunk}</p>")
-                    else:
-                        # Wait a bit before retry
-                        import asyncio
-                        await asyncio.sleep(1)
-        
+        async for i, text, ok in self._rewrite_chunks(chunks, keywords_to_use, tone):
+            rewritten_chunks[i] = text
+            successful += ok
+
         # Combine all chunks
         combined = "\n\n".join(rewritten_chunks)
         
-        print(f"\n{'='*70}")
-        print(f"[ContentRewriting]  COMPLETE!")
-        print(f"[ContentRewriting] Chunks: {successful}/{total_chunks} successfully rewritten")
-        print(f"[ContentRewriting] Original: {original_length} chars")
-        print(f"[ContentRewriting] Rewritten: {len(combined)} chars")
-        print(f"{'='*70}\n")
+        logger.info(
+            "[ContentRewriting]  Complete: %s/%s chunks rewritten, %s → %s chars",
+            successful, total_chunks, original_length, len(combined)
+        )
         
         return {
             "status": "success",
@@ -863,6 +1331,92 @@ TEXT TO REWRITE:
             "total_chunks": total_chunks
         }
 
+    async def _rewrite_chunks(self, chunks: List[str], keywords: List[str], tone: str):
+        """
+        Rewrite chunks concurrently, yielding (index, html, ok) tuples in
+        completion order.
+
+        An async generator so streaming callers can forward each chunk as
+        soon as it finishes instead of waiting on the whole gather. The
+        semaphore keeps a long article from monopolizing the Azure
+        connection pool.
+        """
+        total_chunks = len(chunks)
+        semaphore = asyncio.Semaphore(min(total_chunks, 8))
+
+        async def rewrite_chunk(i: int, chunk: str) -> tuple:
+            chunk_num = i + 1
+            max_retries = 2
+
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        rewritten = await self._rewrite_section(
+                            section=chunk,
+                            keywords=keywords,
+                            section_num=chunk_num,
+                            total_sections=total_chunks,
+                            tone=tone
+                        )
+
+                        if rewritten and len(rewritten) > 50:
+                            logger.info("[ContentRewriting]  Chunk %s: %s → %s chars", chunk_num, len(chunk), len(rewritten))
+                            return i, rewritten, True
+                        logger.warning("[ContentRewriting] ️ Chunk %s attempt %s: LLM returned too little", chunk_num, attempt + 1)
+
+                    except Exception as e:
+                        error_msg = str(e)[:150]
+                        logger.warning("[ContentRewriting]  Chunk %s attempt %s error: %s", chunk_num, attempt + 1, error_msg)
+
+                        if attempt < max_retries - 1:
+                            # Wait a bit before retry
+                            await asyncio.sleep(1)
+
+                # All attempts failed, use original with basic HTML
+                logger.warning("[ContentRewriting] ️ Using original content for chunk %s", chunk_num)
+                return i, f"<p>{chunk}</p>", False
+
+        tasks = [asyncio.create_task(rewrite_chunk(i, chunk)) for i, chunk in enumerate(chunks)]
+        for future in asyncio.as_completed(tasks):
+            yield await future
+
+    async def rewrite_content_for_seo_stream(
+        self,
+        content: str,
+        target_keywords: List[str],
+        tone: str = "professional"
+    ):
+        """
+        Streaming variant of rewrite_content_for_seo: yields one event dict
+        per rewritten chunk as it completes (completion order, each tagged
+        with its index), then a final summary event. Lets the endpoint
+        deliver the first rewritten chunk in roughly one LLM round-trip
+        instead of the whole pipeline's wall time.
+        """
+        if not target_keywords:
+            raise Exception("No target keywords provided")
+
+        keywords_to_use = target_keywords[:3]
+        chunks = self._split_into_sections(content, max_chunk_size=4000)
+        total_chunks = len(chunks)
+
+        logger.info(
+            "[ContentRewriting]  Streaming rewrite: %s chars, %s chunks, keywords %s",
+            len(content), total_chunks, keywords_to_use
+        )
+
+        successful = 0
+        async for i, text, ok in self._rewrite_chunks(chunks, keywords_to_use, tone):
+            successful += ok
+            yield {"chunk": i, "total_chunks": total_chunks, "html": text, "rewritten": ok}
+
+        yield {
+            "done": True,
+            "chunks_processed": successful,
+            "total_chunks": total_chunks,
+            "target_keywords": keywords_to_use
+        }
+
 
 # Global instance
 llm_client = AzureOpenAIClient()
@@ -0,0 +1,44 @@
+"""
+Non-blocking logging for the SEO Agent
+
+print() writes and flushes stdout synchronously, which stalls the event loop
+when called from async request handlers. Loggers from this module push records
+onto an in-memory queue; a background listener thread performs the actual
+stream writes, keeping I/O off the hot async path.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_LEVEL = os.getenv("SEO_AGENT_LOG_LEVEL", "INFO").upper()
+
+_listener = None
+
+
+def _ensure_listener() -> None:
+    """Install the queue handler + listener thread once per process."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger("seo_agent")
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(QueueHandler(log_queue))
+    root.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger that writes through the shared non-blocking queue."""
+    _ensure_listener()
+    return logging.getLogger(f"seo_agent.{name}")
@@ -4,7 +4,7 @@ Uses SEMrush URLs for keyword research - actual data must be retrieved via brows
 """
 
 from typing import Dict, List
-from backend.config import SEMRUSH_URL_TEMPLATE
+from backend.config import make_semrush_url
 
 
 class SEMrushAnalyzer:
@@ -15,8 +15,10 @@ class SEMrushAnalyzer:
     
     def classify_keyword(self, keyword: str) -> Dict:
         """Classify a keyword by type based on word count"""
-        word_count = len(keyword.split())
-        
+        # count(' ') avoids the token-list allocation split() makes per call;
+        # keywords are single-space normalized so the counts agree
+        word_count = keyword.count(' ') + 1
+
         return {
             'type': 'long_tail' if word_count >= 3 else 'short_tail',
             'word_count': word_count
@@ -24,7 +26,7 @@ class SEMrushAnalyzer:
     
     def get_semrush_url(self, keyword: str) -> str:
         """Generate SEMrush URL for a keyword"""
-        return SEMRUSH_URL_TEMPLATE.format(keyword=keyword.replace(' ', '+'))
+        return make_semrush_url(keyword)
     
     def analyze_keyword(self, keyword: str) -> Dict:
         """Return keyword with classification and SEMrush URL"""
@@ -39,19 +41,26 @@ class SEMrushAnalyzer:
     
     def analyze_keywords_batch(self, keywords: List[str]) -> Dict:
         """Analyze multiple keywords"""
+        # One fused pass: build results and tally both tail counts together
+        # instead of rescanning the result list twice
         results = []
+        short_tail_count = 0
+        long_tail_count = 0
         for keyword in keywords:
-            if keyword and isinstance(keyword, str):
-                results.append(self.analyze_keyword(keyword))
-        
-        short_tail = [r for r in results if r['type'] == 'short_tail']
-        long_tail = [r for r in results if r['type'] == 'long_tail']
-        
+            if not keyword or not isinstance(keyword, str):
+                continue
+            analyzed = self.analyze_keyword(keyword)
+            if analyzed['type'] == 'short_tail':
+                short_tail_count += 1
+            else:
+                long_tail_count += 1
+            results.append(analyzed)
+
         return {
             'keywords_analyzed': len(results),
             'results': results,
-            'short_tail_count': len(short_tail),
-            'long_tail_count': len(long_tail)
+            'short_tail_count': short_tail_count,
+            'long_tail_count': long_tail_count
         }
 
 
@@ -0,0 +1,60 @@
+"""
+Prompt input budgeting for the SEO Agent
+
+Long articles cost prompt tokens (and latency) roughly linearly, but most
+of the keyword signal sits in the lead plus a spread of the body. This
+module trims article content to a configurable token budget: keep the lead
+intact, then stride-sample sentences from the remainder so late sections
+still contribute.
+
+Token counts are approximated at 4 characters per token - close enough for
+budgeting without pulling in a tokenizer dependency.
+"""
+
+import re
+
+from backend.config import MAX_INPUT_TOKENS
+
+# Rough chars-per-token ratio for English prose
+_CHARS_PER_TOKEN = 4
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def budget_content(content: str, max_tokens: int = None) -> str:
+    """
+    Trim content to roughly max_tokens worth of characters.
+
+    Keeps the leading ~60% of the budget verbatim (the intro carries the
+    densest keyword signal), then fills the rest by sampling sentences
+    evenly across the remaining body instead of hard-truncating.
+    """
+    if max_tokens is None:
+        max_tokens = MAX_INPUT_TOKENS
+
+    budget_chars = max_tokens * _CHARS_PER_TOKEN
+    if len(content) <= budget_chars:
+        return content
+
+    lead_chars = int(budget_chars * 0.6)
+    lead = content[:lead_chars]
+    remainder_budget = budget_chars - len(lead)
+
+    sentences = _SENTENCE_SPLIT_RE.split(content[lead_chars:])
+    sampled = []
+    sampled_chars = 0
+    if sentences:
+        # Evenly spaced sample across the rest of the article
+        stride = max(1, len(sentences) * 80 // max(remainder_budget, 1))
+        for sentence in sentences[::stride]:
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if sampled_chars + len(sentence) + 1 > remainder_budget:
+                break
+            sampled.append(sentence)
+            sampled_chars += len(sentence) + 1
+
+    if not sampled:
+        return lead
+    return f"{lead}\n[...]\n" + ' '.join(sampled)
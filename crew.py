@@ -10,8 +10,11 @@ from datetime import datetime
 
 from agents.competitor_agent import CompetitorFetchingAgent
 from agents.keyword_extraction_agent import KeywordExtractionAgent
-from agents.competitive_analysis_agent import CompetitiveAnalysisAgent
+from agents.competitive_analysis_agent import CompetitiveAnalysisAgent, AnalysisResult
 from agents.content_rewriting_agent import ContentRewritingAgent
+from backend.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class SEOAgentCrew:
@@ -26,12 +29,12 @@ class SEOAgentCrew:
     """
     
     def __init__(self):
-        print("[SEOAgentCrew] Initializing 4 agents...")
+        logger.info("[SEOAgentCrew] Initializing 4 agents...")
         self.competitor_agent = CompetitorFetchingAgent()
         self.keyword_agent = KeywordExtractionAgent()
         self.analysis_agent = CompetitiveAnalysisAgent()
         self.rewriting_agent = ContentRewritingAgent()
-        print("[SEOAgentCrew] All agents initialized")
+        logger.info("[SEOAgentCrew] All agents initialized")
     
     # ===== AGENT 1: Competitor Fetching =====
     def get_competitors(self, product: str) -> Dict[str, Any]:
@@ -39,7 +42,7 @@ class SEOAgentCrew:
         Agent 1: Fetch competitors for a selected product.
         Uses: CompetitorFetchingAgent
         """
-        print(f"[Agent 1: CompetitorFetching] Getting competitors for {product}")
+        logger.info("[Agent 1: CompetitorFetching] Getting competitors for %s", product)
         return self.competitor_agent.execute(product)
     
     # ===== AGENT 2: Keyword Extraction =====
@@ -48,7 +51,7 @@ class SEOAgentCrew:
         Agent 2 - Step 1: Scrape content from URL
         Uses: KeywordExtractionAgent
         """
-        print(f"[Agent 2: KeywordExtraction] Scraping URL: {url}")
+        logger.info("[Agent 2: KeywordExtraction] Scraping URL: %s", url)
         return await self.keyword_agent.scrape_url(url)
     
     async def extract_article_keywords(
@@ -63,7 +66,7 @@ class SEOAgentCrew:
         Agent 2 - Step 2: Extract keywords from article
         Uses: KeywordExtractionAgent
         """
-        print(f"[Agent 2: KeywordExtraction] Extracting article keywords")
+        logger.info("[Agent 2: KeywordExtraction] Extracting article keywords")
         return await self.keyword_agent.extract_article_keywords(
             title=title,
             headings=headings,
@@ -82,7 +85,7 @@ class SEOAgentCrew:
         article_content: str = "",
         article_headings: List[str] = None,
         article_url: str = ""
-    ) -> Dict[str, Any]:
+    ) -> AnalysisResult:
         """
         Agent 3: Analyze competitor keywords for each article keyword
         Uses: CompetitiveAnalysisAgent
@@ -90,7 +93,7 @@ class SEOAgentCrew:
         NEW: Uses dynamic capability-based analysis to find equivalent
         pages on competitor websites.
         """
-        print(f"[Agent 3: CompetitiveAnalysis] Dynamic capability-based analysis")
+        logger.info("[Agent 3: CompetitiveAnalysis] Dynamic capability-based analysis")
         return await self.analysis_agent.analyze_competitor_keywords(
             article_keywords=article_keywords,
             product=product,
@@ -112,7 +115,7 @@ class SEOAgentCrew:
         Agent 4: Rewrite content for SEO optimization
         Uses: ContentRewritingAgent
         """
-        print(f"[Agent 4: ContentRewriting] Rewriting content with {len(target_keywords)} keywords")
+        logger.info("[Agent 4: ContentRewriting] Rewriting content with %s keywords", len(target_keywords))
         return await self.rewriting_agent.rewrite_content(content, target_keywords, tone)
     
     # ===== FULL PIPELINE =====
@@ -132,12 +135,10 @@ class SEOAgentCrew:
         
         Returns complete analysis with article, competitor, and suggested keywords.
         """
-        print(f"\n{'='*50}")
-        print(f"[SEOAgentCrew] Starting full analysis pipeline")
-        print(f"URL: {url}")
-        print(f"Product: {product}")
-        print(f"Time Range: {time_range}")
-        print(f"{'='*50}\n")
+        logger.info(
+            "[SEOAgentCrew] Starting full analysis pipeline: url=%s product=%s time_range=%s",
+            url, product, time_range
+        )
         
         # Agent 1: Get competitors
         competitor_result = self.get_competitors(product)
@@ -165,16 +166,16 @@ class SEOAgentCrew:
         )
         
         # Get capability info if available
-        capability = analysis_result.get("capability", {})
-        
-        print(f"\n{'='*50}")
-        print(f"[SEOAgentCrew] Analysis complete!")
-        print(f"Capability Identified: {capability.get('name', 'N/A')}")
-        print(f"Article Keywords: {len(analysis_result['article_keywords'])}")
-        print(f"Competitor Keywords: {len(analysis_result['competitor_keywords'])}")
-        print(f"Suggested Keywords: {len(analysis_result['suggested_keywords'])}")
-        print(f"{'='*50}\n")
-        
+        capability = analysis_result.capability
+
+        logger.info(
+            "[SEOAgentCrew] Analysis complete! capability=%s, %s article / %s competitor / %s suggested keywords",
+            capability.get('name', 'N/A'),
+            len(analysis_result.article_keywords),
+            len(analysis_result.competitor_keywords),
+            len(analysis_result.suggested_keywords)
+        )
+
         return {
             "status": "success",
             "url": url,
@@ -183,10 +184,10 @@ class SEOAgentCrew:
             "time_range": time_range,
             "capability": capability,
             "competitors": competitor_names,
-            "article_keywords": analysis_result["article_keywords"],
-            "competitor_keywords": analysis_result["competitor_keywords"],
-            "suggested_keywords": analysis_result["suggested_keywords"],
-            "keyword_mappings": analysis_result["keyword_mappings"],
+            "article_keywords": analysis_result.article_keywords,
+            "competitor_keywords": analysis_result.competitor_keywords,
+            "suggested_keywords": analysis_result.suggested_keywords,
+            "keyword_mappings": analysis_result.keyword_mappings,
             "original_content": scraped["content"],
             "timestamp": datetime.now().isoformat()
         }
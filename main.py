@@ -7,33 +7,39 @@ Excludes product names from keywords.
 No fallbacks - raises exceptions on failure.
 """
 
-import re
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+import orjson
 from pydantic import BaseModel
 from typing import List
 
 from backend.config import SERVER_HOST, SERVER_PORT, PRODUCT_COMPETITORS
+from backend.logger import get_logger
 from crew import seo_crew  # Import the agent orchestrator - ALL operations go through this
 
+logger = get_logger(__name__)
+
 # Custom tag for API documentation
 API_TAG = "Competitive Vocabulary Intelligence Agent APIs"
 
-# URL Validation Patterns for each product type
+# Required URL prefix for each product type. The accepted shape is just
+# "<prefix>" or "<prefix>/...", so a startswith check replaces the regex
+# the validation used to run per request.
 URL_PATTERNS = {
     "Forms": {
-        "pattern": r"^https://experienceleague\.adobe\.com/en/docs/experience-manager-cloud-service/content/forms(/.*)?$",
+        "prefix": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/forms",
         "example": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/forms/...",
         "description": "Forms URLs must start with: https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/forms/"
     },
     "Assets": {
-        "pattern": r"^https://experienceleague\.adobe\.com/en/docs/experience-manager-cloud-service/content/assets(/.*)?$",
+        "prefix": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/assets",
         "example": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/assets/...",
         "description": "Assets URLs must start with: https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/assets/"
     },
     "Sites": {
-        "pattern": r"^https://experienceleague\.adobe\.com/en/docs/experience-manager-cloud-service/content/sites(/.*)?$",
+        "prefix": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/sites",
         "example": "https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/sites/...",
         "description": "Sites URLs must start with: https://experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/sites/"
     }
@@ -42,22 +48,24 @@ URL_PATTERNS = {
 
 def validate_url_for_product(url: str, product: str) -> tuple[bool, str]:
     """
-    Validate if the URL matches the expected pattern for the selected product.
-    
+    Validate if the URL matches the expected prefix for the selected product.
+
     Returns:
         tuple: (is_valid, error_message)
     """
     if product not in URL_PATTERNS:
         return False, "Invalid URL"
-    
-    pattern_info = URL_PATTERNS[product]
-    pattern = pattern_info["pattern"]
-    
-    if re.match(pattern, url):
-        return True, ""
-    else:
+
+    prefix = URL_PATTERNS[product]["prefix"]
+    if not url.startswith(prefix):
         return False, "Invalid URL"
 
+    # The tail after the prefix must be empty or a path segment
+    tail = url[len(prefix):]
+    if tail == "" or tail.startswith("/"):
+        return True, ""
+    return False, "Invalid URL"
+
 
 app = FastAPI(
     title="Competitive Vocabulary Intelligence Agent",
@@ -70,9 +78,21 @@ app = FastAPI(
         }
     ],
     # Hide the Schemas section in Swagger UI
-    swagger_ui_parameters={"defaultModelsExpandDepth": -1}
+    swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+    # orjson serializes the large keyword payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Drain the pooled HTTP clients so keep-alive connections close cleanly."""
+    from backend.llm_client import llm_client
+    from backend.scraper import scraper
+    await llm_client.aclose()
+    await scraper.aclose()
+    await seo_crew.competitor_agent.aclose()
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -99,6 +119,12 @@ class ContentRewriteRequest(BaseModel):
     tone: str = "professional"
 
 
+class BatchExtractRequest(BaseModel):
+    urls: List[str]
+    time_range: str = "month"
+    max_keywords: int = 10
+
+
 # Health Check
 @app.get("/health", tags=[API_TAG])
 async def health_check():
@@ -118,6 +144,7 @@ async def root():
             "GET /api/products": "Get product list (Forms, Assets, Sites)",
             "POST /api/competitors": "Get competitors for a product",
             "POST /api/analyze": "Analyze URL - returns Article, Competitor, Suggested keywords",
+            "POST /api/extract-keywords-batch": "Extract keywords from multiple URLs concurrently",
             "POST /api/rewrite-content": "Rewrite content for SEO"
         }
     }
@@ -144,7 +171,7 @@ async def get_competitors(request: ProductRequest):
         )
     
     competitors = PRODUCT_COMPETITORS[request.product]
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "status": "success",
         "data": {
             "product": request.product,
@@ -174,14 +201,12 @@ async def analyze_url(request: AnalyzeRequest):
     - Assets: URL must be from experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/assets/
     - Sites: URL must be from experienceleague.adobe.com/en/docs/experience-manager-cloud-service/content/sites/
     """
-    print(f"\n[API] /api/analyze called")
-    print(f"[API] URL: {request.url}")
-    print(f"[API] Product: {request.product}")
-    print(f"[API] Time Range: {request.time_range}")
+    logger.info("[API] /api/analyze called: url=%s product=%s time_range=%s",
+                request.url, request.product, request.time_range)
     
     # Validate product
     if request.product not in PRODUCT_COMPETITORS:
-        print(f"[API]  Invalid product: {request.product}")
+        logger.warning("[API]  Invalid product: %s", request.product)
         raise HTTPException(
             status_code=400, 
             detail=f"Invalid product. Options: {list(PRODUCT_COMPETITORS.keys())}"
@@ -189,7 +214,7 @@ async def analyze_url(request: AnalyzeRequest):
     
     # Validate time_range
     if request.time_range not in ["week", "month", "year"]:
-        print(f"[API]  Invalid time_range: {request.time_range}")
+        logger.warning("[API]  Invalid time_range: %s", request.time_range)
         raise HTTPException(status_code=400, detail="time_range must be: week, month, or year")
     
     url = request.url
@@ -199,10 +224,10 @@ async def analyze_url(request: AnalyzeRequest):
     # Validate URL matches the selected product type
     is_valid, error_message = validate_url_for_product(url, product)
     if not is_valid:
-        print(f"[API]  Invalid URL for product {product}: {url}")
+        logger.warning("[API]  Invalid URL for product %s: %s", product, url)
         raise HTTPException(status_code=400, detail=error_message)
     
-    print(f"[API]  Validation passed, starting analysis...")
+    logger.info("[API]  Validation passed, starting analysis...")
     
     try:
         # ===== USE SEO_CREW (All 4 Agents) =====
@@ -214,19 +239,59 @@ async def analyze_url(request: AnalyzeRequest):
         )
         
         if result.get("status") == "error":
-            print(f"[API]  Analysis error: {result.get('error')}")
+            logger.warning("[API]  Analysis error: %s", result.get('error'))
             raise HTTPException(status_code=400, detail=result.get("error", "Analysis failed"))
         
-        print(f"[API]  Analysis complete!")
-        return JSONResponse(content={"status": "success", "data": result})
+        logger.info("[API]  Analysis complete!")
+        return ORJSONResponse(content={"status": "success", "data": result})
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[API]  Exception: {str(e)[:200]}")
+        logger.warning("[API]  Exception: %s", str(e)[:200])
         raise HTTPException(status_code=500, detail=str(e)[:500])
 
 
+# Batch Keyword Extraction - Uses KeywordExtractionAgent
+@app.post("/api/extract-keywords-batch", tags=[API_TAG])
+async def extract_keywords_batch(request: BatchExtractRequest):
+    """
+    Extract keywords from multiple URLs concurrently.
+
+    URLs are processed in parallel (bounded concurrency); each result is
+    either a successful extraction or a per-URL error entry.
+    """
+    logger.info("[API] /api/extract-keywords-batch called: %s URLs", len(request.urls))
+
+    if not request.urls:
+        raise HTTPException(status_code=400, detail="At least one URL required")
+
+    if len(request.urls) > 20:
+        raise HTTPException(status_code=400, detail="Maximum 20 URLs per batch")
+
+    try:
+        results = await seo_crew.keyword_agent.full_extraction_batch(
+            urls=request.urls,
+            time_range=request.time_range,
+            max_keywords=request.max_keywords
+        )
+
+        succeeded = sum(1 for r in results if r.get("status") == "success")
+        logger.info("[API]  Batch extraction complete! %s/%s succeeded", succeeded, len(results))
+        return ORJSONResponse(content={
+            "status": "success",
+            "data": {
+                "results": results,
+                "total": len(results),
+                "succeeded": succeeded
+            }
+        })
+
+    except Exception as e:
+        logger.warning("[API]  Batch extraction exception: %s", str(e)[:200])
+        raise HTTPException(status_code=500, detail=f"Batch extraction failed: {str(e)[:300]}")
+
+
 # Content Rewriting - Uses ContentRewritingAgent
 @app.post("/api/rewrite-content", tags=[API_TAG])
 async def rewrite_content(request: ContentRewriteRequest):
@@ -236,9 +301,8 @@ async def rewrite_content(request: ContentRewriteRequest):
     Takes content and up to 3 target keywords, returns SEO-optimized content with HTML formatting.
     Uses chunked processing to handle long articles.
     """
-    print(f"\n[API] /api/rewrite-content called")
-    print(f"[API] Content length: {len(request.content)} chars")
-    print(f"[API] Keywords: {request.target_keywords}")
+    logger.info("[API] /api/rewrite-content called: %s chars, keywords %s",
+                len(request.content), request.target_keywords)
     
     if len(request.target_keywords) > 3:
         raise HTTPException(status_code=400, detail="Maximum 3 keywords allowed")
@@ -258,19 +322,64 @@ async def rewrite_content(request: ContentRewriteRequest):
         )
         
         if result.get("status") == "error":
-            print(f"[API]  Rewrite error: {result.get('error')}")
+            logger.warning("[API]  Rewrite error: %s", result.get('error'))
             raise HTTPException(status_code=400, detail=result.get("error", "Content rewriting failed"))
         
-        print(f"[API]  Rewrite complete! {result.get('chunks_processed', 0)}/{result.get('total_chunks', 0)} chunks")
-        return JSONResponse(content={"status": "success", "data": result})
+        logger.info("[API]  Rewrite complete! %s/%s chunks", result.get('chunks_processed', 0), result.get('total_chunks', 0))
+        return ORJSONResponse(content={"status": "success", "data": result})
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[API]  Rewrite exception: {str(e)[:200]}")
+        logger.warning("[API]  Rewrite exception: %s", str(e)[:200])
         raise HTTPException(status_code=500, detail=f"Content rewriting failed: {str(e)[:300]}")
 
 
+# Streaming Content Rewriting - newline-delimited JSON, one event per chunk
+@app.post("/api/rewrite-content/stream", tags=[API_TAG])
+async def rewrite_content_stream(request: ContentRewriteRequest):
+    """
+    Stream SEO content rewriting as NDJSON.
+
+    Emits one JSON line per rewritten chunk as it completes (tagged with
+    its chunk index, in completion order) and a final {"done": true}
+    summary line, so clients see the first chunk after roughly one LLM
+    round-trip instead of the full pipeline latency. The non-streaming
+    /api/rewrite-content endpoint is unchanged.
+    """
+    logger.info("[API] /api/rewrite-content/stream called: %s chars, keywords %s",
+                len(request.content), request.target_keywords)
+
+    if len(request.target_keywords) > 3:
+        raise HTTPException(status_code=400, detail="Maximum 3 keywords allowed")
+
+    if not request.content.strip():
+        raise HTTPException(status_code=400, detail="Content cannot be empty")
+
+    if not request.target_keywords:
+        raise HTTPException(status_code=400, detail="At least one keyword required")
+
+    from backend.llm_client import llm_client
+
+    async def event_lines():
+        try:
+            async for event in llm_client.rewrite_content_for_seo_stream(
+                content=request.content,
+                target_keywords=request.target_keywords,
+                tone=request.tone
+            ):
+                yield orjson.dumps(event) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"error": str(e)[:300]}) + b"\n"
+
+    return StreamingResponse(
+        event_lines(),
+        media_type="application/x-ndjson",
+        # Keep reverse proxies from buffering the stream back into one blob
+        headers={"X-Accel-Buffering": "no"}
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
@@ -7,12 +7,15 @@ so it can be integrated with Cursor, ChatGPT, and other AI assistants.
 
 import asyncio
 import httpx
-import json
+import orjson
+from itertools import islice
 from typing import Any, Dict, List
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 from mcp.server.stdio import stdio_server
 
+from backend.cache import TTLCache
+
 # Backend configuration
 BACKEND_URL = "http://127.0.0.1:8000"
 API_TIMEOUT = 300.0  # 5 minutes for long-running analyses
@@ -20,104 +23,187 @@ API_TIMEOUT = 300.0  # 5 minutes for long-running analyses
 # Initialize MCP server
 app = Server("seo-keyword-assistant")
 
+# Product/competitor lookups are static tables server-side; a short TTL
+# cache serves repeat tool calls without a backend round-trip. The
+# content-dependent analyze/rewrite tools stay uncached.
+_lookup_cache = TTLCache(maxsize=100, ttl=300.0)
 
-def create_http_client() -> httpx.AsyncClient:
-    """Create an async HTTP client for backend communication"""
-    return httpx.AsyncClient(timeout=API_TIMEOUT)
 
+# Shared HTTP client reused across tool calls: keep-alive pooling avoids a
+# fresh TCP handshake per invocation. Created lazily so it binds to the
+# running event loop.
+_http_client: httpx.AsyncClient | None = None
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """
-    List all available SEO analysis tools.
-    """
-    return [
-        Tool(
-            name="get_products",
-            description="Get list of available product types (Assets, Forms, Sites)",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared backend client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            timeout=API_TIMEOUT,
+            # HTTP/2 lets short lookups multiplex past a long-running
+            # analyze_url call instead of queueing behind it on HTTP/1.1
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0
+            )
+        )
+    return _http_client
+
+
+# The tool list is a pure constant; build it once at import instead of
+# re-instantiating four Tool objects and their nested schemas on every
+# tools/list request (clients re-list on reconnect).
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_products",
+        description="Get list of available product types (Assets, Forms, Sites)",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_competitors",
+        description="Get competitor list for a specific product type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "product": {
+                    "type": "string",
+                    "description": "Product type: Assets, Forms, or Sites",
+                    "enum": ["Assets", "Forms", "Sites"]
+                }
+            },
+            "required": ["product"]
+        }
+    ),
+    Tool(
+        name="analyze_url",
+        description=(
+            "Perform comprehensive SEO analysis on a URL. "
+            "Returns article keywords, competitor keywords, and suggested keywords with search volumes. "
+            "This is the main tool for getting keyword suggestions. "
+            "URL must be from Adobe Experience League docs for the specified product."
         ),
-        Tool(
-            name="get_competitors",
-            description="Get competitor list for a specific product type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "product": {
-                        "type": "string",
-                        "description": "Product type: Assets, Forms, or Sites",
-                        "enum": ["Assets", "Forms", "Sites"]
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to analyze (must be from experienceleague.adobe.com)"
+                },
+                "product": {
+                    "type": "string",
+                    "description": "Product type: Assets, Forms, or Sites",
+                    "enum": ["Assets", "Forms", "Sites"]
                 },
-                "required": ["product"]
-            }
+                "time_range": {
+                    "type": "string",
+                    "description": "Time range for search volume data",
+                    "enum": ["week", "month", "year"],
+                    "default": "month"
+                }
+            },
+            "required": ["url", "product", "time_range"]
+        }
+    ),
+    Tool(
+        name="extract_keywords_batch",
+        description=(
+            "Extract SEO keywords from multiple URLs concurrently. "
+            "Returns keywords with search volumes per URL; failed URLs are "
+            "reported individually without failing the batch."
         ),
-        Tool(
-            name="analyze_url",
-            description=(
-                "Perform comprehensive SEO analysis on a URL. "
-                "Returns article keywords, competitor keywords, and suggested keywords with search volumes. "
-                "This is the main tool for getting keyword suggestions. "
-                "URL must be from Adobe Experience League docs for the specified product."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to analyze (must be from experienceleague.adobe.com)"
-                    },
-                    "product": {
-                        "type": "string",
-                        "description": "Product type: Assets, Forms, or Sites",
-                        "enum": ["Assets", "Forms", "Sites"]
-                    },
-                    "time_range": {
-                        "type": "string",
-                        "description": "Time range for search volume data",
-                        "enum": ["week", "month", "year"],
-                        "default": "month"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "description": "URLs to extract keywords from (max 20)",
+                    "items": {"type": "string"},
+                    "maxItems": 20,
+                    "minItems": 1
+                },
+                "time_range": {
+                    "type": "string",
+                    "description": "Time range for search volume data",
+                    "enum": ["week", "month", "year"],
+                    "default": "month"
                 },
-                "required": ["url", "product", "time_range"]
-            }
+                "max_keywords": {
+                    "type": "integer",
+                    "description": "Maximum keywords per URL",
+                    "default": 10
+                }
+            },
+            "required": ["urls"]
+        }
+    ),
+    Tool(
+        name="rewrite_content",
+        description=(
+            "Rewrite content for SEO optimization using target keywords. "
+            "Returns SEO-optimized content with HTML formatting. "
+            "Accepts up to 3 keywords."
         ),
-        Tool(
-            name="rewrite_content",
-            description=(
-                "Rewrite content for SEO optimization using target keywords. "
-                "Returns SEO-optimized content with HTML formatting. "
-                "Accepts up to 3 keywords."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "Original content to rewrite"
-                    },
-                    "target_keywords": {
-                        "type": "array",
-                        "description": "Target keywords for SEO optimization (max 3)",
-                        "items": {"type": "string"},
-                        "maxItems": 3,
-                        "minItems": 1
-                    },
-                    "tone": {
-                        "type": "string",
-                        "description": "Writing tone",
-                        "enum": ["professional", "casual", "technical"],
-                        "default": "professional"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "Original content to rewrite"
                 },
-                "required": ["content", "target_keywords"]
-            }
+                "target_keywords": {
+                    "type": "array",
+                    "description": "Target keywords for SEO optimization (max 3)",
+                    "items": {"type": "string"},
+                    "maxItems": 3,
+                    "minItems": 1
+                },
+                "tone": {
+                    "type": "string",
+                    "description": "Writing tone",
+                    "enum": ["professional", "casual", "technical"],
+                    "default": "professional"
+                }
+            },
+            "required": ["content", "target_keywords"]
+        }
+    )
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    List all available SEO analysis tools.
+    """
+    return _TOOLS
+
+
+def _backend_error(response: httpx.Response) -> List[TextContent]:
+    """
+    Format a backend error response as tool output.
+
+    Called off a plain response.is_error check so the failure path costs
+    one branch instead of a raise_for_status/except round-trip through
+    exception machinery.
+    """
+    try:
+        detail = orjson.loads(response.content).get(
+            "detail", f"HTTP {response.status_code}"
         )
-    ]
+    except Exception:
+        detail = f"HTTP {response.status_code}"
+    return [TextContent.model_construct(
+        type="text",
+        text=f"Error calling backend API: {detail}"
+    )]
 
 
 @app.call_tool()
@@ -126,195 +212,280 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
     Handle tool calls and route them to the appropriate backend endpoint.
     """
     
-    async with create_http_client() as client:
-        try:
-            if name == "get_products":
-                # GET /api/products
-                response = await client.get(f"{BACKEND_URL}/api/products")
-                response.raise_for_status()
-                data = response.json()
-                
+    client = _get_http_client()
+    try:
+        if name == "get_products":
+            # GET /api/products
+            result_text = _lookup_cache.get("products")
+            if result_text is None:
+                response = await client.get("/api/products")
+                if response.is_error:
+                    return _backend_error(response)
+                data = orjson.loads(response.content)
+
                 products = data.get("products", [])
-                result_text = "Available Products:\n"
-                for product in products:
-                    result_text += f"- {product}\n"
-                
-                return [TextContent(type="text", text=result_text)]
-            
-            elif name == "get_competitors":
-                # POST /api/competitors
-                product = arguments.get("product")
-                
+                result_text = "Available Products:\n" + "".join(
+                    f"- {product}\n" for product in products
+                )
+                _lookup_cache.set("products", result_text)
+
+            return [TextContent.model_construct(type="text", text=result_text)]
+        
+        elif name == "get_competitors":
+            # POST /api/competitors
+            product = arguments.get("product")
+
+            cache_key = f"competitors:{product}"
+            result_text = _lookup_cache.get(cache_key)
+            if result_text is None:
                 response = await client.post(
-                    f"{BACKEND_URL}/api/competitors",
+                    "/api/competitors",
                     json={"product": product}
                 )
-                response.raise_for_status()
-                data = response.json()
-                
+                if response.is_error:
+                    return _backend_error(response)
+                data = orjson.loads(response.content)
+
                 competitors = data.get("data", {}).get("competitors", [])
-                result_text = f"Competitors for {product}:\n\n"
-                for comp in competitors:
-                    result_text += f"• {comp['name']}\n"
-                    result_text += f"  URL: {comp['url']}\n\n"
-                
-                return [TextContent(type="text", text=result_text)]
-            
-            elif name == "analyze_url":
-                # POST /api/analyze - Main SEO analysis
-                url = arguments.get("url")
-                product = arguments.get("product")
-                time_range = arguments.get("time_range", "month")
-                
-                # This is a long-running operation
-                response = await client.post(
-                    f"{BACKEND_URL}/api/analyze",
-                    json={
-                        "url": url,
-                        "product": product,
-                        "time_range": time_range
-                    }
+                result_text = f"Competitors for {product}:\n\n" + "".join(
+                    f"• {comp['name']}\n  URL: {comp['url']}\n\n"
+                    for comp in competitors
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract analysis results
-                analysis = data.get("data", {})
-                article_keywords = analysis.get("article_keywords", [])
-                competitor_keywords = analysis.get("competitor_keywords", [])
-                suggested_keywords = analysis.get("suggested_keywords", [])
-                capability = analysis.get("capability", {})
-                
-                # Format the results
-                result_text = f"# SEO Analysis Results\n\n"
-                result_text += f"**URL:** {analysis.get('url', url)}\n"
-                result_text += f"**Title:** {analysis.get('title', 'N/A')}\n"
-                result_text += f"**Product:** {product}\n"
-                result_text += f"**Time Range:** {time_range}\n\n"
-                
-                if capability:
-                    result_text += f"**Identified Capability:** {capability.get('name', 'N/A')}\n"
-                    result_text += f"**Description:** {capability.get('description', 'N/A')}\n\n"
-                
-                # Article Keywords
-                result_text += f"## Article Keywords ({len(article_keywords)})\n"
-                result_text += "Keywords extracted from the analyzed URL:\n\n"
-                for kw in article_keywords[:20]:  # Show top 20
-                    result_text += f"- **{kw.get('keyword')}**\n"
-                    result_text += f"  - Volume: {kw.get('search_volume', 'N/A')}\n"
-                    result_text += f"  - Source: {kw.get('source', 'N/A')}\n"
-                    if kw.get('semrush_url'):
-                        result_text += f"  - [View in SEMrush]({kw.get('semrush_url')})\n"
-                    result_text += "\n"
-                
-                # Competitor Keywords
-                result_text += f"\n## Competitor Keywords ({len(competitor_keywords)})\n"
-                result_text += "Keywords that competitors rank for:\n\n"
-                for kw in competitor_keywords[:20]:  # Show top 20
-                    result_text += f"- **{kw.get('keyword')}**\n"
-                    result_text += f"  - Volume: {kw.get('search_volume', 'N/A')}\n"
-                    result_text += f"  - Competitor: {kw.get('competitor', 'N/A')}\n"
-                    if kw.get('semrush_url'):
-                        result_text += f"  - [View in SEMrush]({kw.get('semrush_url')})\n"
-                    result_text += "\n"
-                
-                # Suggested Keywords (TOP 10 HIGH-VOLUME)
-                result_text += f"\n##  SUGGESTED KEYWORDS ({len(suggested_keywords)})\n"
-                result_text += "**Top 10 high-volume keywords combining article and competitor analysis:**\n\n"
-                for i, kw in enumerate(suggested_keywords, 1):
-                    result_text += f"{i}. **{kw.get('keyword')}**\n"
-                    result_text += f"   - Volume: {kw.get('search_volume', 'N/A')}\n"
-                    result_text += f"   - Source: {kw.get('source', 'N/A')}\n"
-                    if kw.get('competitor'):
-                        result_text += f"   - Found on: {kw.get('competitor')}\n"
-                    if kw.get('semrush_url'):
-                        result_text += f"   - [View in SEMrush]({kw.get('semrush_url')})\n"
-                    result_text += "\n"
-                
-                # Add keyword mappings summary
-                keyword_mappings = analysis.get("keyword_mappings", [])
-                if keyword_mappings:
-                    result_text += "\n## Keyword Relationships\n"
-                    result_text += "How article keywords map to competitor keywords:\n\n"
-                    for mapping in keyword_mappings[:10]:
-                        article_kw_data = mapping.get('article_keyword', {})
-                        article_kw = article_kw_data.get('keyword', 'N/A')
-                        comp_kws = mapping.get('competitor_keywords', [])
-                        if comp_kws:
-                            comp_kw_names = [k.get('keyword', '') for k in comp_kws[:3]]
-                            result_text += f"**{article_kw}** → {', '.join(comp_kw_names)}\n"
-                
-                return [TextContent(type="text", text=result_text)]
+                _lookup_cache.set(cache_key, result_text)
+
+            return [TextContent.model_construct(type="text", text=result_text)]
+        
+        elif name == "analyze_url":
+            # POST /api/analyze - Main SEO analysis
+            url = arguments.get("url")
+            product = arguments.get("product")
+            time_range = arguments.get("time_range", "month")
             
-            elif name == "rewrite_content":
-                # POST /api/rewrite-content
-                content = arguments.get("content")
-                target_keywords = arguments.get("target_keywords", [])
-                tone = arguments.get("tone", "professional")
-                
-                response = await client.post(
-                    f"{BACKEND_URL}/api/rewrite-content",
-                    json={
-                        "content": content,
-                        "target_keywords": target_keywords,
-                        "tone": tone
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                rewrite_result = data.get("data", {})
-                rewritten_content = rewrite_result.get("rewritten_content", "")
-                chunks_processed = rewrite_result.get("chunks_processed", 0)
-                total_chunks = rewrite_result.get("total_chunks", 0)
-                
-                result_text = f"# SEO-Optimized Content\n\n"
-                result_text += f"**Keywords Used:** {', '.join(target_keywords)}\n"
-                result_text += f"**Tone:** {tone}\n"
-                result_text += f"**Chunks Processed:** {chunks_processed}/{total_chunks}\n\n"
-                result_text += "---\n\n"
-                result_text += rewritten_content
-                
-                return [TextContent(type="text", text=result_text)]
+            # This is a long-running operation
+            response = await client.post(
+                "/api/analyze",
+                json={
+                    "url": url,
+                    "product": product,
+                    "time_range": time_range
+                }
+            )
+            if response.is_error:
+                return _backend_error(response)
+            data = orjson.loads(response.content)
             
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"Unknown tool: {name}"
-                )]
+            # Extract analysis results
+            analysis = data.get("data", {})
+            article_keywords = analysis.get("article_keywords", [])
+            competitor_keywords = analysis.get("competitor_keywords", [])
+            suggested_keywords = analysis.get("suggested_keywords", [])
+            capability = analysis.get("capability", {})
+            
+            # Format the results; append fragments to a list and join once
+            # at the end - += rebuilds the whole string on every concat
+            parts = [
+                f"# SEO Analysis Results\n\n"
+                f"**URL:** {analysis.get('url', url)}\n"
+                f"**Title:** {analysis.get('title', 'N/A')}\n"
+                f"**Product:** {product}\n"
+                f"**Time Range:** {time_range}\n\n"
+            ]
+
+            if capability:
+                parts.append(
+                    f"**Identified Capability:** {capability.get('name', 'N/A')}\n"
+                    f"**Description:** {capability.get('description', 'N/A')}\n\n"
+                )
+
+            # Article Keywords (empty sections skip their headers and
+            # allocate nothing; islice avoids copying the top-20 slice)
+            if article_keywords:
+                parts.append(
+                    f"## Article Keywords ({len(article_keywords)})\n"
+                    "Keywords extracted from the analyzed URL:\n\n"
+                )
+            for kw in islice(article_keywords, 20):  # Show top 20
+                parts.append(
+                    f"- **{kw.get('keyword')}**\n"
+                    f"  - Volume: {kw.get('search_volume', 'N/A')}\n"
+                    f"  - Source: {kw.get('source', 'N/A')}\n"
+                )
+                if (semrush_url := kw.get('semrush_url')):
+                    parts.append(f"  - [View in SEMrush]({semrush_url})\n")
+                parts.append("\n")
+
+            # Competitor Keywords
+            if competitor_keywords:
+                parts.append(
+                    f"\n## Competitor Keywords ({len(competitor_keywords)})\n"
+                    "Keywords that competitors rank for:\n\n"
+                )
+            for kw in islice(competitor_keywords, 20):  # Show top 20
+                parts.append(
+                    f"- **{kw.get('keyword')}**\n"
+                    f"  - Volume: {kw.get('search_volume', 'N/A')}\n"
+                    f"  - Competitor: {kw.get('competitor', 'N/A')}\n"
+                )
+                if (semrush_url := kw.get('semrush_url')):
+                    parts.append(f"  - [View in SEMrush]({semrush_url})\n")
+                parts.append("\n")
+
+            # Suggested Keywords (TOP 10 HIGH-VOLUME)
+            if suggested_keywords:
+                parts.append(
+                    f"\n##  SUGGESTED KEYWORDS ({len(suggested_keywords)})\n"
+                    "**Top 10 high-volume keywords combining article and competitor analysis:**\n\n"
+                )
+            for i, kw in enumerate(suggested_keywords, 1):
+                parts.append(
+                    f"{i}. **{kw.get('keyword')}**\n"
+                    f"   - Volume: {kw.get('search_volume', 'N/A')}\n"
+                    f"   - Source: {kw.get('source', 'N/A')}\n"
+                )
+                if (competitor := kw.get('competitor')):
+                    parts.append(f"   - Found on: {competitor}\n")
+                if (semrush_url := kw.get('semrush_url')):
+                    parts.append(f"   - [View in SEMrush]({semrush_url})\n")
+                parts.append("\n")
+
+            # Add keyword mappings summary
+            keyword_mappings = analysis.get("keyword_mappings", [])
+            if keyword_mappings:
+                parts.append(
+                    "\n## Keyword Relationships\n"
+                    "How article keywords map to competitor keywords:\n\n"
+                )
+                for mapping in islice(keyword_mappings, 10):
+                    article_kw = mapping.get('article_keyword', {}).get('keyword', 'N/A')
+                    comp_kws = mapping.get('competitor_keywords', [])
+                    if comp_kws:
+                        comp_kw_names = ', '.join(
+                            k.get('keyword', '') for k in islice(comp_kws, 3)
+                        )
+                        parts.append(f"**{article_kw}** → {comp_kw_names}\n")
+
+            return [TextContent.model_construct(type="text", text="".join(parts))]
         
-        except httpx.HTTPStatusError as e:
-            error_detail = "Unknown error"
-            try:
-                error_data = e.response.json()
-                error_detail = error_data.get("detail", str(e))
-            except:
-                error_detail = str(e)
+        elif name == "extract_keywords_batch":
+            # POST /api/extract-keywords-batch
+            urls = arguments.get("urls", [])
+            time_range = arguments.get("time_range", "month")
+            max_keywords = arguments.get("max_keywords", 10)
+
+            response = await client.post(
+                "/api/extract-keywords-batch",
+                json={
+                    "urls": urls,
+                    "time_range": time_range,
+                    "max_keywords": max_keywords
+                }
+            )
+            if response.is_error:
+                return _backend_error(response)
+            data = orjson.loads(response.content)
+
+            batch = data.get("data", {})
+            results = batch.get("results", [])
+
+            parts = [
+                f"# Batch Keyword Extraction\n\n"
+                f"**URLs processed:** {batch.get('total', len(results))}\n"
+                f"**Succeeded:** {batch.get('succeeded', 0)}\n\n"
+            ]
+
+            for result in results:
+                parts.append(f"## {result.get('url', 'N/A')}\n")
+                if result.get("status") != "success":
+                    parts.append(f"Error: {result.get('error', 'Unknown error')}\n\n")
+                    continue
+                parts.append(f"**Title:** {result.get('title', 'N/A')}\n\n")
+                for kw in result.get("keywords", []):
+                    parts.append(
+                        f"- **{kw.get('keyword')}**\n"
+                        f"  - Volume: {kw.get('search_volume', 'N/A')}\n"
+                    )
+                    if (semrush_url := kw.get('semrush_url')):
+                        parts.append(f"  - [View in SEMrush]({semrush_url})\n")
+                parts.append("\n")
+
+            return [TextContent.model_construct(type="text", text="".join(parts))]
+
+        elif name == "rewrite_content":
+            # POST /api/rewrite-content
+            content = arguments.get("content")
+            target_keywords = arguments.get("target_keywords", [])
+            tone = arguments.get("tone", "professional")
             
-            return [TextContent(
-                type="text",
-                text=f"Error calling backend API: {error_detail}"
-            )]
+            response = await client.post(
+                "/api/rewrite-content",
+                json={
+                    "content": content,
+                    "target_keywords": target_keywords,
+                    "tone": tone
+                }
+            )
+            if response.is_error:
+                return _backend_error(response)
+            data = orjson.loads(response.content)
+            
+            rewrite_result = data.get("data", {})
+            rewritten_content = rewrite_result.get("rewritten_content", "")
+            chunks_processed = rewrite_result.get("chunks_processed", 0)
+            total_chunks = rewrite_result.get("total_chunks", 0)
+            
+            result_text = (
+                f"# SEO-Optimized Content\n\n"
+                f"**Keywords Used:** {', '.join(target_keywords)}\n"
+                f"**Tone:** {tone}\n"
+                f"**Chunks Processed:** {chunks_processed}/{total_chunks}\n\n"
+                "---\n\n"
+                f"{rewritten_content}"
+            )
+
+            return [TextContent.model_construct(type="text", text=result_text)]
         
-        except Exception as e:
-            return [TextContent(
+        else:
+            return [TextContent.model_construct(
                 type="text",
-                text=f"Error: {str(e)}"
+                text=f"Unknown tool: {name}"
             )]
+    
+    except Exception as e:
+        return [TextContent.model_construct(
+            type="text",
+            text=f"Error: {str(e)}"
+        )]
+
+
+# Computed once at import (all handlers are registered above); per-spawn
+# stdio hosts restart the server often enough that init cost counts.
+_INIT_OPTIONS = app.create_initialization_options()
 
 
 async def main():
     """
     Run the MCP server using stdio transport.
     """
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                _INIT_OPTIONS
+            )
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
 
 
 if __name__ == "__main__":
+    # uvloop speeds up asyncio socket I/O 2-3x where available; absent
+    # (e.g. Windows) the default loop is used
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
 
@@ -0,0 +1,58 @@
+"""
+Regression tests for ContentRewritingAgent._calculate_keyword_density
+
+The fused single-scan counter must report the same counts as independent
+per-keyword scans, in particular for phrase keywords that overlap
+positionally in the text ("alpha beta" / "beta gamma" over "alpha beta
+gamma") and for keywords that contain one another ("seo" / "seo tools").
+
+Run directly (python test_keyword_density.py) or via pytest.
+"""
+
+import re
+
+from agents.content_rewriting_agent import ContentRewritingAgent
+
+agent = ContentRewritingAgent()
+
+
+def _baseline_density(content, keywords):
+    """Independent per-keyword scans - the reference implementation."""
+    content_lower = content.lower()
+    word_count = len(content.split())
+    density = {}
+    for keyword in keywords:
+        pattern = rf'\b{re.escape(keyword.lower())}\b'
+        count = len(re.findall(pattern, content_lower))
+        keyword_word_count = len(keyword.split())
+        density[keyword] = round((count * keyword_word_count / word_count) * 100, 2) if word_count > 0 else 0
+    return density
+
+
+def test_cross_overlapping_phrases():
+    # "beta" starts inside a match of "alpha beta" - a consuming scan
+    # would report "beta gamma" as 0
+    content = "alpha beta gamma " * 10
+    keywords = ["alpha beta", "beta gamma"]
+    assert agent._calculate_keyword_density(content, keywords) == _baseline_density(content, keywords)
+
+
+def test_containment_fallback():
+    # "seo" is a substring of "seo tools" - both must be counted at
+    # shared starting positions
+    content = "seo tools are great seo " * 8
+    keywords = ["seo", "seo tools"]
+    assert agent._calculate_keyword_density(content, keywords) == _baseline_density(content, keywords)
+
+
+def test_mixed_phrases_and_misses():
+    content = "fast seo audit with fast seo tools and audit tips today ok"
+    keywords = ["fast seo", "seo tools", "audit", "missing keyword"]
+    assert agent._calculate_keyword_density(content, keywords) == _baseline_density(content, keywords)
+
+
+if __name__ == "__main__":
+    test_cross_overlapping_phrases()
+    test_containment_fallback()
+    test_mixed_phrases_and_misses()
+    print("All keyword density tests passed")